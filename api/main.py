@@ -2,33 +2,85 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import sys
-from datetime import datetime
+import threading
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict
+from typing import Annotated, AsyncIterator, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
+import cachetools
+import numpy as np
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-# Add parent directory to path for imports
+# Make the ``src`` package and the sibling schemas module importable.  The
+# models use package-relative imports, so they must be imported as ``src.*``.
 root_dir = Path(__file__).resolve().parents[1]
-if str(root_dir / "src") not in sys.path:
-    sys.path.insert(0, str(root_dir / "src"))
-if str(root_dir / "api") not in sys.path:
-    sys.path.insert(0, str(root_dir / "api"))
+for path in (root_dir, root_dir / "api"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
 
 from schemas import PredictRequest, PredictResponse, WhatIfRequest, WhatIfResponse, ModelInfo  # noqa: E402
-from logging_conf import setup_logging  # noqa: E402
-from models.forecast import Forecaster  # noqa: E402
-from models.registry import get_model_metadata  # noqa: E402
+from src.config import (  # noqa: E402
+    MODEL_INFO_MAX_AGE,
+    PORT_API,
+    PREDICT_CACHE_SIZE,
+    PREDICT_CACHE_TTL,
+    UVICORN_WORKERS,
+)
+from src.logging_conf import setup_logging  # noqa: E402
+from src.models.forecast import Forecaster  # noqa: E402
+from src.models.registry import get_model_metadata, list_models  # noqa: E402
 
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
 
-app = FastAPI(title="GCC Oil Forecast API", version="0.1.0")
+# Horizon served by /predict and /whatif
+DEFAULT_HORIZON = 1
+
+_FORECASTERS_LOCK = threading.Lock()
+
+
+def _load_forecaster(forecasters: Dict[int, Forecaster], horizon: int) -> Forecaster:
+    """Return the Forecaster for ``horizon`` from ``forecasters``, loading it on first use."""
+    forecaster = forecasters.get(horizon)
+    if forecaster is None:
+        with _FORECASTERS_LOCK:
+            forecaster = forecasters.get(horizon)
+            if forecaster is None:
+                forecaster = Forecaster(horizon)
+                forecasters[horizon] = forecaster
+    return forecaster
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Load the default model when a worker starts rather than on its first request.
+
+    Each uvicorn worker process runs this independently, so models are loaded
+    in the worker itself and never pickled across the fork.
+    """
+    try:
+        await asyncio.to_thread(_load_forecaster, app.state.forecasters, DEFAULT_HORIZON)
+    except Exception as exc:
+        logger.warning("Could not preload model for horizon %d: %s", DEFAULT_HORIZON, exc)
+    yield
+
+
+app = FastAPI(
+    lifespan=lifespan,
+    title="GCC Oil Forecast API",
+    version="0.1.0",
+    # orjson encodes the float-heavy prediction payloads much faster than stdlib json
+    default_response_class=ORJSONResponse,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -36,6 +88,54 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# One Forecaster per horizon, shared by all requests handled by this worker
+app.state.forecasters = {}
+
+
+def get_forecaster(request: Request) -> Forecaster:
+    """FastAPI dependency returning the shared Forecaster for the default horizon.
+
+    Declared as a plain function so FastAPI resolves it in its threadpool and a
+    first-time model load never blocks the event loop.
+    """
+    try:
+        return _load_forecaster(request.app.state.forecasters, DEFAULT_HORIZON)
+    except Exception as exc:
+        logger.exception("Model loading failed: %s", exc)
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+# Shared Forecaster injected into the prediction endpoints
+ForecasterDep = Annotated[Forecaster, Depends(get_forecaster)]
+
+
+# Recent /predict results keyed on the request payload.  Only touched from the
+# event loop thread, so no locking is needed.
+_PREDICT_CACHE: cachetools.TTLCache = cachetools.TTLCache(
+    maxsize=PREDICT_CACHE_SIZE, ttl=PREDICT_CACHE_TTL
+)
+
+
+def _predict_cache_key(
+    horizon: int, dates: List[str], scenario: Optional[Dict[str, np.ndarray]]
+) -> str:
+    """Return a canonical hash of a prediction request."""
+    payload = orjson.dumps(
+        (horizon, dates, scenario), option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# Registry metadata per horizon; it only changes when a new model is promoted.
+_MODEL_META_CACHE: cachetools.TTLCache = cachetools.TTLCache(maxsize=32, ttl=MODEL_INFO_MAX_AGE)
+
+
+def _model_metadata_blocking(h: int) -> Dict[str, object]:
+    """Look up registry metadata for the model serving horizon ``h``."""
+    names = list_models(prefix=f"gcc_oil_forecast_h{h}_")
+    if not names:
+        raise ValueError(f"No model registered for horizon {h}")
+    return get_model_metadata(names[0])
 
 
 @app.get("/health")
@@ -45,30 +145,55 @@ async def health() -> Dict[str, str]:
 
 
 @app.post("/predict", response_model=PredictResponse)
-async def predict(req: PredictRequest) -> PredictResponse:
+async def predict(
+    req: PredictRequest, forecaster: ForecasterDep
+) -> Response:
     """Return predictions for the specified dates and optional scenario."""
     try:
         # Determine horizon as the number of months between today and first prediction date
         dates = req.dates
         if not dates:
             raise HTTPException(status_code=400, detail="At least one date must be provided.")
-        # Use horizon based on first date difference; default to 1 month
-        _ = datetime.fromisoformat(dates[0])  # Validate date format
-        # Compute month difference from last known date; fallback to 1 if negative
-        horizon = 1
-        forecaster = Forecaster(horizon)
-        predictions = forecaster.predict(dates=dates, scenario=req.scenario)
-        return PredictResponse(predictions=predictions)
+        # The horizon is fixed by the injected forecaster (DEFAULT_HORIZON)
+        key = _predict_cache_key(forecaster.horizon, dates, req.scenario)
+        predictions = _PREDICT_CACHE.get(key)
+        if predictions is None:
+            # Run the model off the event loop so concurrent requests are not serialised
+            # Hand the model column-oriented arrays rather than per-row records
+            columns = {**(req.scenario or {}), "date": req.parsed_dates.astype("datetime64[ns]")}
+            predictions = await asyncio.to_thread(forecaster.predict_fast, columns)
+            _PREDICT_CACHE[key] = predictions
+        # Serialise the float32 array directly rather than via a list of Python floats
+        body = orjson.dumps(
+            {"predictions": predictions, "intervals": None}, option=orjson.OPT_SERIALIZE_NUMPY
+        )
+        return Response(content=body, media_type="application/json")
     except Exception as exc:
         logger.exception("Prediction failed: %s", exc)
-        raise HTTPException(status_code=500, detail=str(exc))
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @app.get("/model/{h}/info", response_model=ModelInfo)
-async def model_info(h: int) -> ModelInfo:
-    """Return metadata about the current model for horizon h."""
+async def model_info(h: int, request: Request, response: Response) -> ModelInfo:
+    """Return metadata about the current model for horizon h.
+
+    Responses carry an ``ETag`` derived from the run ID and version, so
+    clients revalidating with ``If-None-Match`` get an empty 304 until a new
+    model is promoted.
+    """
     try:
-        meta = get_model_metadata(prefix=f"gcc_oil_forecast_h{h}")
+        meta = _MODEL_META_CACHE.get(h)
+        if meta is None:
+            meta = await asyncio.to_thread(_model_metadata_blocking, h)
+            _MODEL_META_CACHE[h] = meta
+        etag = '"%s"' % hashlib.blake2b(
+            f"{meta['run_id']}:{meta['version']}".encode(), digest_size=16
+        ).hexdigest()
+        headers = {"ETag": etag, "Cache-Control": f"max-age={MODEL_INFO_MAX_AGE}"}
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
         return ModelInfo(
             horizon=h,
             run_id=meta["run_id"],
@@ -77,11 +202,13 @@ async def model_info(h: int) -> ModelInfo:
         )
     except Exception as exc:
         logger.exception("Model info retrieval failed: %s", exc)
-        raise HTTPException(status_code=404, detail=str(exc))
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
 
 
 @app.post("/whatif", response_model=WhatIfResponse)
-async def what_if(req: WhatIfRequest) -> WhatIfResponse:
+async def what_if(
+    req: WhatIfRequest, forecaster: ForecasterDep
+) -> WhatIfResponse:
     """Perform a simple what‑if analysis for a single date.
 
     Returns the baseline prediction for the given date and the predictions
@@ -91,20 +218,35 @@ async def what_if(req: WhatIfRequest) -> WhatIfResponse:
         date = req.date
         variable = req.variable
         values = req.values
-        # Use horizon of 1 month for what‑if analysis
-        horizon = 1
-        forecaster = Forecaster(horizon)
-        # Baseline prediction uses no scenario override
-        baseline_pred = forecaster.predict(dates=[date])[0]
-        # Generate scenario predictions
-        scenario = {variable: values}
-        preds = forecaster.predict(dates=[date] * len(values), scenario=scenario)
+        preds_all = await asyncio.to_thread(forecaster.predict_what_if, date, variable, values)
         return WhatIfResponse(
-            baseline_prediction=baseline_pred,
+            baseline_prediction=float(preds_all[0]),
             variable=variable,
             values=values,
-            predictions=preds,
+            predictions=preds_all[1:].tolist(),
         )
     except Exception as exc:
         logger.exception("What‑if analysis failed: %s", exc)
-        raise HTTPException(status_code=500, detail=str(exc))
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+def run() -> None:
+    """Serve the API with multiple worker processes, uvloop and httptools.
+
+    Run from the project root so that ``api.main`` is importable.  The number
+    of workers is controlled by the ``UVICORN_WORKERS`` environment variable.
+    """
+    import uvicorn
+
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=PORT_API,
+        workers=UVICORN_WORKERS,
+        loop="uvloop",
+        http="httptools",
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+import re
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
+
+# Columns a scenario may not override: the dates, the forecast target and the
+# lag/rolling features, which are recomputed from the inputs
+_RESERVED_SCENARIO_KEYS = frozenset({"date", "saudi_production"})
+_DERIVED_FEATURE_RE = re.compile(r"_(lag|roll_[a-z]+)_\d+")
 
 
 class PredictRequest(BaseModel):
@@ -12,10 +20,47 @@ class PredictRequest(BaseModel):
     dates: List[str] = Field(
         ..., min_length=1, description="List of ISO 8601 dates (YYYY-MM-DD) to forecast."
     )
-    scenario: Optional[Dict[str, List[float]]] = Field(
+    scenario: Optional[Dict[str, Any]] = Field(
         default=None,
         description="Optional scenario values keyed by feature name; each list must align with dates.",
     )
+    _parsed_dates: np.ndarray = PrivateAttr()
+
+    @field_validator("scenario")
+    @classmethod
+    def _scenario_to_arrays(cls, v: Optional[Dict[str, Any]]) -> Optional[Dict[str, np.ndarray]]:
+        """Convert each scenario list to a float64 array in one NumPy call.
+
+        This replaces Pydantic's per-element float validation, which dominates
+        request parsing for long scenarios.  Keys naming the dates, the target
+        or a derived feature are rejected so they cannot replace model inputs.
+        """
+        if not v:
+            return None
+        for name in v:
+            if name in _RESERVED_SCENARIO_KEYS or _DERIVED_FEATURE_RE.search(name):
+                raise ValueError(f"Scenario key {name!r} is not a feature input")
+        arrays = {}
+        for name, values in v.items():
+            arr = np.asarray(values, dtype=np.float64)
+            if arr.ndim != 1:
+                raise ValueError(f"Scenario values for {name!r} must be a flat list of numbers")
+            arrays[name] = arr
+        return arrays
+
+    @model_validator(mode="after")
+    def _parse_dates(self) -> "PredictRequest":
+        """Parse all dates in one NumPy call and keep the result for the forecaster."""
+        try:
+            self._parsed_dates = np.array(self.dates, dtype="datetime64[D]")
+        except ValueError as exc:
+            raise ValueError(f"Dates must be ISO 8601 strings (YYYY-MM-DD): {exc}") from exc
+        return self
+
+    @property
+    def parsed_dates(self) -> np.ndarray:
+        """The requested dates as a ``datetime64[D]`` array."""
+        return self._parsed_dates
 
 
 class PredictResponse(BaseModel):
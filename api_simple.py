@@ -1,18 +1,16 @@
 """Simplified API entry point that works around import issues."""
 
-import sys
-from pathlib import Path
-
-# Add paths before any imports
-root_dir = Path(__file__).parent
-sys.path.insert(0, str(root_dir / "src"))
-sys.path.insert(0, str(root_dir / "api"))
-
+import numpy as np
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Create a simple mock API for demo purposes
-app = FastAPI(title="GCC Oil Forecast API (Demo)", version="0.1.0")
+app = FastAPI(
+    title="GCC Oil Forecast API (Demo)",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -38,29 +36,20 @@ def predict(request: dict):
     
     # Realistic baseline: Saudi production around 2800-3200 MBPD
     baseline = 2950.0
+    brent = np.asarray(brent_prices, dtype=np.float64)
+    i = np.arange(len(brent))
     
-    # Generate realistic predictions based on Brent price
-    predictions = []
-    for i, brent in enumerate(brent_prices):
-        # Price effect: higher prices -> higher production
-        price_effect = (brent - 75) * 2.5  # ~2.5 MBPD per dollar
-        
-        # Slight upward trend
-        trend = i * 5
-        
-        # Some variation
-        variation = (i % 3 - 1) * 15
-        
-        pred = baseline + price_effect + trend + variation
-        # Keep within realistic bounds (2000-3500 MBPD)
-        pred = max(2000, min(3500, pred))
-        predictions.append(round(pred, 1))
+    # Price effect: higher prices -> higher production (~2.5 MBPD per dollar),
+    # a slight upward trend and some variation
+    predictions = baseline + (brent - 75) * 2.5 + i * 5 + (i % 3 - 1) * 15
+    # Keep within realistic bounds (2000-3500 MBPD)
+    predictions = np.clip(predictions, 2000, 3500).round(1)
     
     return {
-        "predictions": predictions,
+        "predictions": predictions.tolist(),
         "intervals": {
-            "lower": [round(p * 0.97, 1) for p in predictions],  # -3% uncertainty
-            "upper": [round(p * 1.03, 1) for p in predictions]   # +3% uncertainty
+            "lower": (predictions * 0.97).round(1).tolist(),  # -3% uncertainty
+            "upper": (predictions * 1.03).round(1).tolist()   # +3% uncertainty
         }
     }
 
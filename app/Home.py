@@ -6,46 +6,30 @@ along with key drivers and allows users to navigate to deeper analyses.
 
 from __future__ import annotations
 
-import datetime as dt
 import logging
-import sys
-from pathlib import Path
 from typing import List
 
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
-import requests
 
-# Add parent directory to path for imports
-root_dir = Path(__file__).resolve().parents[1]
-if str(root_dir / "src") not in sys.path:
-    sys.path.insert(0, str(root_dir / "src"))
-
-from config import PORT_API
+from _api import get_api_client
 
 
 logger = logging.getLogger(__name__)
 
 
-API_URL = f"http://localhost:{PORT_API}"
-
-
 def get_next_months(n: int = 6) -> List[str]:
     """Return a list of ISO 8601 dates for the next n months."""
-    today = dt.date.today().replace(day=1)
-    dates = []
-    for i in range(1, n + 1):
-        year = today.year + (today.month + i - 1) // 12
-        month = (today.month + i - 1) % 12 + 1
-        dates.append(dt.date(year, month, 1).isoformat())
-    return dates
+    # MonthBegin rolls forward to the first day of the following month
+    start = pd.Timestamp.today().normalize() + pd.offsets.MonthBegin(1)
+    return pd.date_range(start, periods=n, freq="MS").strftime("%Y-%m-%d").tolist()
 
 
 def fetch_forecast(dates: List[str]) -> List[float]:
     """Call the prediction API to fetch forecasts."""
     try:
-        resp = requests.post(f"{API_URL}/predict", json={"dates": dates})
+        resp = get_api_client().post("/predict", json={"dates": dates})
         resp.raise_for_status()
         data = resp.json()
         return data.get("predictions", [])
@@ -0,0 +1,26 @@
+"""HTTP client for the forecast API shared by all Streamlit pages."""
+
+from __future__ import annotations
+
+import _pathboot  # noqa: F401  (puts src/ on sys.path)
+import httpx
+import streamlit as st
+
+from config import PORT_API
+
+API_URL = f"http://localhost:{PORT_API}"
+
+
+@st.cache_resource
+def get_api_client() -> httpx.Client:
+    """Return one HTTP client per Streamlit process so every page reuses its connections.
+
+    A synchronous client is used on purpose: an ``httpx.AsyncClient`` is bound
+    to the event loop it first ran on and cannot be reused across the fresh
+    loops that ``asyncio.run`` would create on every rerun.
+    """
+    return httpx.Client(
+        base_url=API_URL,
+        timeout=5.0,
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+    )
@@ -0,0 +1,30 @@
+"""Feature matrix loader shared by the Streamlit pages."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import _pathboot  # noqa: F401  (puts src/ on sys.path)
+import pandas as pd
+import streamlit as st
+
+from config import FEATURES_PATH
+
+
+@st.cache_data(ttl=3600)
+def _read_features(mtime: float) -> pd.DataFrame:
+    # ``mtime`` only keys the cache so a rebuilt feature file is picked up.
+    return pd.read_parquet(FEATURES_PATH, engine="pyarrow")
+
+
+def features_mtime() -> float:
+    """Modification time of the feature file, for keying caches derived from it."""
+    return FEATURES_PATH.stat().st_mtime
+
+
+def load_features(mtime: Optional[float] = None) -> pd.DataFrame:
+    """Return the processed feature matrix, read once per file version for all pages.
+
+    Pass ``mtime`` when it has already been looked up for the current run.
+    """
+    return _read_features(features_mtime() if mtime is None else mtime)
@@ -0,0 +1,14 @@
+"""Make the ``src`` modules importable from the Streamlit app.
+
+Streamlit puts the directory of the entry script (``app/``) on ``sys.path``,
+so the home page and every page import this module before importing from
+``src``.  Python caches the import, so the path is resolved and inserted once
+per process rather than on every page run.
+"""
+
+import sys
+from pathlib import Path
+
+SRC_DIR = str(Path(__file__).resolve().parents[1] / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
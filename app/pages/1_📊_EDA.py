@@ -2,24 +2,123 @@
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-import pandas as pd
 import numpy as np
+import pandas as pd
 import streamlit as st
+from _data import features_mtime, load_features
+
+
+@st.cache_data(ttl=3600)
+def _eda_aggregates(mtime: float) -> dict:
+    """Compute the widget-independent aggregates shown on the page once per file version."""
+    df = load_features(mtime)
+    base_features = ['saudi_production', 'brent_price', 'renewables_value', 'world_obs_value']
+    available_features = [f for f in base_features if f in df.columns]
+    correlations = None
+    if len(available_features) > 1:
+        # One float32 corrcoef over complete rows instead of pandas' pairwise .corr()
+        arr = df[available_features].to_numpy(dtype=np.float32)
+        arr = arr[~np.isnan(arr).any(axis=1)]
+        corr = np.corrcoef(arr, rowvar=False, dtype=np.float32)
+        correlations = pd.Series(corr[0, 1:], index=available_features[1:]).sort_values(ascending=False)
+    yearly = df.groupby(df['date'].dt.year.rename('year')).agg({
+        'saudi_production': 'mean',
+        'brent_price': 'mean'
+    }).reset_index()
+    return {
+        "correlations": correlations,
+        "price_corr": float(correlations['brent_price']),
+        "yearly": yearly,
+    }
+
 
-# Add parent directory to path for imports
-root_dir = Path(__file__).resolve().parents[1]
-if str(root_dir / "src") not in sys.path:
-    sys.path.insert(0, str(root_dir / "src"))
+# Figures depend only on the features file, so they are built once per file
+# version and the same object is reused across reruns and sessions.
+@st.cache_resource(ttl=3600)
+def _correlation_fig(mtime: float):
+    import plotly.graph_objects as go
+
+    correlations = _eda_aggregates(mtime)["correlations"]
+    fig = go.Figure(data=[
+        go.Bar(x=correlations.index, y=correlations.values)
+    ])
+    fig.update_layout(
+        xaxis_title="",
+        yaxis_title="Correlation",
+        xaxis_tickangle=0,  # Horizontal labels
+        height=400,
+        margin=dict(l=20, r=20, t=20, b=80),  # More bottom margin for horizontal labels
+        showlegend=False
+    )
+    return fig
+
+
+@st.cache_resource(ttl=3600)
+def _production_price_fig(mtime: float):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    df = load_features(mtime)
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    
+    # Add production trace
+    fig.add_trace(
+        go.Scatter(x=df['date'], y=df['saudi_production'], 
+                   name="Saudi Production (MBPD)", 
+                   line=dict(color='#1f77b4', width=2)),
+        secondary_y=False
+    )
+    
+    # Add price trace
+    fig.add_trace(
+        go.Scatter(x=df['date'], y=df['brent_price'], 
+                   name="Brent Price ($/bbl)", 
+                   line=dict(color='#ff7f0e', width=2)),
+        secondary_y=True
+    )
+    
+    # Update layout
+    fig.update_xaxes(title_text="Date")
+    fig.update_yaxes(title_text="Production (MBPD)", secondary_y=False)
+    fig.update_yaxes(title_text="Brent Price ($/bbl)", secondary_y=True)
+    fig.update_layout(
+        height=450,
+        hovermode='x unified',
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
 
-from config import PROCESSED_DATA_DIR
 
+@st.cache_resource(ttl=3600)
+def _yearly_bar_fig(mtime: float, column: str, label: str, color_scale: str):
+    import plotly.express as px
 
-def load_features() -> pd.DataFrame:
-    df = pd.read_csv(PROCESSED_DATA_DIR / "features.csv", parse_dates=["date"])
-    return df
+    yearly_stats = _eda_aggregates(mtime)["yearly"]
+    fig = px.bar(yearly_stats, x='year', y=column,
+                 labels={column: label, 'year': 'Year'},
+                 color=column,
+                 color_continuous_scale=color_scale)
+    fig.update_layout(height=300, showlegend=False, margin=dict(l=20, r=20, t=20, b=40))
+    return fig
+
+
+@st.fragment
+def _custom_explorer(df: pd.DataFrame) -> None:
+    """Variable explorer; runs as a fragment so changing the selection only reruns this chart."""
+    st.write("Compare any features to explore relationships")
+    
+    all_vars = ['saudi_production', 'brent_price'] + [c for c in df.columns if c not in {'date', 'saudi_production', 'brent_price'}][:10]
+    
+    selected_vars = st.multiselect(
+        "Select variables", 
+        options=all_vars,
+        default=['saudi_production', 'brent_price'],
+        key="custom_explorer"
+    )
+    
+    if selected_vars:
+        chart_df = df[["date"] + selected_vars].set_index("date")
+        st.line_chart(chart_df, use_container_width=True)
 
 
 def render_eda() -> None:
@@ -30,7 +129,9 @@ def render_eda() -> None:
     Explore key patterns and relationships in the GCC oil production dataset.
     """)
 
-    df = load_features()
+    mtime = features_mtime()
+    df = load_features(mtime)
+    aggregates = _eda_aggregates(mtime)
     
     # Single comprehensive overview
     st.header("📋 Dataset Overview")
@@ -55,26 +156,10 @@ def render_eda() -> None:
     # Correlation - Simple visual
     st.header("🔗 Key Relationships")
     
-    base_features = ['saudi_production', 'brent_price', 'renewables_value', 'world_obs_value']
-    available_features = [f for f in base_features if f in df.columns]
+    correlations = aggregates["correlations"]
     
-    if len(available_features) > 1:
-        import plotly.graph_objects as go
-        
-        correlations = df[available_features].corr()['saudi_production'].drop('saudi_production').sort_values(ascending=False)
-        
-        fig = go.Figure(data=[
-            go.Bar(x=correlations.index, y=correlations.values)
-        ])
-        fig.update_layout(
-            xaxis_title="",
-            yaxis_title="Correlation",
-            xaxis_tickangle=0,  # Horizontal labels
-            height=400,
-            margin=dict(l=20, r=20, t=20, b=80),  # More bottom margin for horizontal labels
-            showlegend=False
-        )
-        st.plotly_chart(fig, use_container_width=True)
+    if correlations is not None:
+        st.plotly_chart(_correlation_fig(mtime), use_container_width=True)
         st.caption("Correlation with Saudi Production: Brent price shows strongest relationship")
     
     # Time Series - Show the story
@@ -84,38 +169,7 @@ def render_eda() -> None:
     st.subheader("Saudi Production & Brent Price Trends")
     
     # Use plotly for better dual-variable visualization
-    import plotly.graph_objects as go
-    from plotly.subplots import make_subplots
-    
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
-    
-    # Add production trace
-    fig.add_trace(
-        go.Scatter(x=df['date'], y=df['saudi_production'], 
-                   name="Saudi Production (MBPD)", 
-                   line=dict(color='#1f77b4', width=2)),
-        secondary_y=False
-    )
-    
-    # Add price trace
-    fig.add_trace(
-        go.Scatter(x=df['date'], y=df['brent_price'], 
-                   name="Brent Price ($/bbl)", 
-                   line=dict(color='#ff7f0e', width=2)),
-        secondary_y=True
-    )
-    
-    # Update layout
-    fig.update_xaxes(title_text="Date")
-    fig.update_yaxes(title_text="Production (MBPD)", secondary_y=False)
-    fig.update_yaxes(title_text="Brent Price ($/bbl)", secondary_y=True)
-    fig.update_layout(
-        height=450,
-        hovermode='x unified',
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(_production_price_fig(mtime), use_container_width=True)
     
     # Quick insight below chart
     col1, col2, col3 = st.columns(3)
@@ -126,46 +180,23 @@ def render_eda() -> None:
         recent_price = df['brent_price'].tail(12).mean()
         st.metric("Recent Price (12mo)", f"${recent_price:.0f}/bbl")
     with col3:
-        corr = df[['brent_price', 'saudi_production']].corr().iloc[0, 1]
-        st.metric("Correlation", f"{corr:.2f}")
+        st.metric("Correlation", f"{aggregates['price_corr']:.2f}")
     
     # Optional: Interactive explorer in expander (not default visible)
     with st.expander("🔍 Custom Variable Explorer"):
-        st.write("Compare any features to explore relationships")
-        
-        all_vars = ['saudi_production', 'brent_price'] + [c for c in df.columns if c not in {'date', 'saudi_production', 'brent_price'}][:10]
-        
-        selected_vars = st.multiselect(
-            "Select variables", 
-            options=all_vars,
-            default=['saudi_production', 'brent_price'],
-            key="custom_explorer"
-        )
-        
-        if selected_vars:
-            chart_df = df[["date"] + selected_vars].set_index("date")
-            st.line_chart(chart_df, use_container_width=True)
+        _custom_explorer(df)
     
     # Year-over-Year Analysis - More insightful than data summary
     st.header("📅 Temporal Analysis")
     
-    # Extract year and calculate yearly averages
-    df['year'] = df['date'].dt.year
-    yearly_stats = df.groupby('year').agg({
-        'saudi_production': 'mean',
-        'brent_price': 'mean'
-    }).reset_index()
+    # Yearly averages
+    yearly_stats = aggregates["yearly"]
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("Production by Year")
-        import plotly.express as px
-        fig = px.bar(yearly_stats, x='year', y='saudi_production', 
-                     labels={'saudi_production': 'Avg Production (MBPD)', 'year': 'Year'},
-                     color='saudi_production',
-                     color_continuous_scale='Blues')
-        fig.update_layout(height=300, showlegend=False, margin=dict(l=20, r=20, t=20, b=40))
+        fig = _yearly_bar_fig(mtime, 'saudi_production', 'Avg Production (MBPD)', 'Blues')
         st.plotly_chart(fig, use_container_width=True)
         
         # Growth insight
@@ -177,11 +208,7 @@ def render_eda() -> None:
     
     with col2:
         st.subheader("Price Volatility by Year")
-        fig = px.bar(yearly_stats, x='year', y='brent_price',
-                     labels={'brent_price': 'Avg Brent Price ($/bbl)', 'year': 'Year'},
-                     color='brent_price',
-                     color_continuous_scale='Oranges')
-        fig.update_layout(height=300, showlegend=False, margin=dict(l=20, r=20, t=20, b=40))
+        fig = _yearly_bar_fig(mtime, 'brent_price', 'Avg Brent Price ($/bbl)', 'Oranges')
         st.plotly_chart(fig, use_container_width=True)
         
         # Volatility insight
@@ -192,7 +219,7 @@ def render_eda() -> None:
             st.caption(f"📊 Volatility: {volatility:.1f}% (coefficient of variation)")
     
     # Bottom line insight
-    corr = df[['brent_price', 'saudi_production']].corr().iloc[0, 1]
+    corr = aggregates["price_corr"]
     
     st.success(f"""
     **🎯 Key Insight:** Strong correlation (r={corr:.2f}) between Brent price and production patterns enables 
@@ -2,23 +2,83 @@
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
+from _data import load_features
 
-# Add parent directory to path for imports
-root_dir = Path(__file__).resolve().parents[1]
-if str(root_dir / "src") not in sys.path:
-    sys.path.insert(0, str(root_dir / "src"))
+EXPLORED_VARIABLES = ("saudi_production", "brent_price", "renewables_value", "world_obs_value")
 
-from config import PROCESSED_DATA_DIR
 
+@st.cache_data
+def _classify_columns(columns: tuple) -> dict:
+    """Group feature columns into base, lag and rolling sets in a single scan.
 
-def load_features() -> pd.DataFrame:
-    return pd.read_csv(PROCESSED_DATA_DIR / "features.csv", parse_dates=["date"])
+    Also pre-selects the first three lag and rolling columns listed for each
+    explored variable.
+    """
+    base, lag, rolling = [], [], []
+    for c in columns:
+        if c == "date":
+            continue
+        if "_lag_" in c:
+            lag.append(c)
+        if "_roll_" in c:
+            rolling.append(c)
+        if "_lag_" not in c and "_roll_" not in c:
+            base.append(c)
+    by_variable = {
+        var: {
+            "lag": [f for f in lag if f.startswith(var)][:3],
+            "roll": [f for f in rolling if f.startswith(var)][:3],
+        }
+        for var in EXPLORED_VARIABLES
+    }
+    return {"base": base, "lag": lag, "roll": rolling, "by_variable": by_variable}
+
+
+@st.fragment
+def _feature_distribution(df: pd.DataFrame) -> None:
+    """Feature explorer; runs as a fragment so picking a feature only reruns this section."""
+    st.subheader("Visualize Feature Behavior")
+    
+    # Interactive feature selector
+    feature_cols = [c for c in df.columns if c != "date"]
+    selected_feature = st.selectbox("Select a feature to visualize", feature_cols, 
+                                   index=feature_cols.index("saudi_production") if "saudi_production" in feature_cols else 0)
+    
+    # Show statistics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Mean", f"{df[selected_feature].mean():.2f}")
+    with col2:
+        st.metric("Std Dev", f"{df[selected_feature].std():.2f}")
+    with col3:
+        st.metric("Min", f"{df[selected_feature].min():.2f}")
+    with col4:
+        st.metric("Max", f"{df[selected_feature].max():.2f}")
+    
+    # Time series plot
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=df["date"],
+        y=df[selected_feature],
+        mode='lines',
+        name=selected_feature,
+        line=dict(color='#1f77b4', width=2),
+        fill='tozeroy',
+        fillcolor='rgba(31, 119, 180, 0.1)'
+    ))
+    fig.update_layout(
+        title=f"{selected_feature} Over Time",
+        xaxis_title="Date",
+        yaxis_title="Value",
+        height=400,
+        hovermode='x unified',
+        template='plotly_white'
+    )
+    st.plotly_chart(fig, use_container_width=True)
 
 
 def render_features_page() -> None:
@@ -54,9 +114,10 @@ def render_features_page() -> None:
     # Feature breakdown with visual cards
     st.header("📊 Feature Categories")
     
-    base_features = [c for c in df.columns if '_lag_' not in c and '_roll_' not in c and c != 'date']
-    lag_features = [c for c in df.columns if "_lag_" in c]
-    rolling_features = [c for c in df.columns if "_roll_" in c]
+    groups = _classify_columns(tuple(df.columns))
+    base_features = groups["base"]
+    lag_features = groups["lag"]
+    rolling_features = groups["roll"]
     
     col1, col2, col3 = st.columns(3)
     
@@ -81,8 +142,8 @@ def render_features_page() -> None:
         Historical values (1, 2, 3, 6, 12 months ago)
         """)
         with st.expander("View by variable"):
-            for var in ["saudi_production", "brent_price", "renewables_value", "world_obs_value"]:
-                var_lags = [f for f in lag_features if f.startswith(var)][:3]  # Show first 3
+            for var in EXPLORED_VARIABLES:
+                var_lags = groups["by_variable"][var]["lag"]  # First 3
                 if var_lags:
                     st.caption(f"**{var}:**")
                     for lag in var_lags:
@@ -97,8 +158,8 @@ def render_features_page() -> None:
         Moving averages & volatility (3, 6, 12 month windows)
         """)
         with st.expander("View by variable"):
-            for var in ["saudi_production", "brent_price", "renewables_value", "world_obs_value"]:
-                var_rolling = [f for f in rolling_features if f.startswith(var)][:3]  # Show first 3
+            for var in EXPLORED_VARIABLES:
+                var_rolling = groups["by_variable"][var]["roll"]  # First 3
                 if var_rolling:
                     st.caption(f"**{var}:**")
                     for roll in var_rolling:
@@ -110,45 +171,7 @@ def render_features_page() -> None:
     tab1, tab2 = st.tabs(["📊 Feature Distribution", "🔍 Data Preview"])
     
     with tab1:
-        st.subheader("Visualize Feature Behavior")
-        
-        # Interactive feature selector
-        feature_cols = [c for c in df.columns if c != "date"]
-        selected_feature = st.selectbox("Select a feature to visualize", feature_cols, 
-                                       index=feature_cols.index("saudi_production") if "saudi_production" in feature_cols else 0)
-        
-        # Show statistics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Mean", f"{df[selected_feature].mean():.2f}")
-        with col2:
-            st.metric("Std Dev", f"{df[selected_feature].std():.2f}")
-        with col3:
-            st.metric("Min", f"{df[selected_feature].min():.2f}")
-        with col4:
-            st.metric("Max", f"{df[selected_feature].max():.2f}")
-        
-        # Time series plot
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=df["date"],
-            y=df[selected_feature],
-            mode='lines',
-            name=selected_feature,
-            line=dict(color='#1f77b4', width=2),
-            fill='tozeroy',
-            fillcolor='rgba(31, 119, 180, 0.1)'
-        ))
-        fig.update_layout(
-            title=f"{selected_feature} Over Time",
-            xaxis_title="Date",
-            yaxis_title="Value",
-            height=400,
-            hovermode='x unified',
-            template='plotly_white'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        _feature_distribution(df)
     
     with tab2:
         st.subheader("Feature Matrix Sample")
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import pandas as pd
-import plotly.graph_objects as go
 import streamlit as st
 
 
+@st.cache_resource
 def load_validation_metrics() -> pd.DataFrame:
-    # Hardcoded table matching docs/validation_report.md; replace with MLflow query in production
+    # Hardcoded table matching docs/validation_report.md; replace with MLflow query in production.
+    # Built once per process and shared by reference (no per-rerun copy); treat as read-only.
     data = {
         "Horizon": [1, 1, 1, 1, 3, 3, 3, 3, 6, 6, 6, 6],
         "Model": [
@@ -71,6 +72,70 @@ def load_validation_metrics() -> pd.DataFrame:
     return pd.DataFrame(data)
 
 
+@st.cache_data
+def _build_metrics_pivot(df: pd.DataFrame) -> pd.DataFrame:
+    """Pivot RMSE and sMAPE to one row per model and one column per horizon."""
+    metrics_pivot = df.pivot_table(
+        index="Model",
+        columns="Horizon",
+        values=["RMSE", "sMAPE"]
+    )
+    
+    # Flatten column names
+    metrics_pivot.columns = [f"{metric} ({horizon}m)" for metric, horizon in metrics_pivot.columns]
+    return metrics_pivot.reset_index()
+
+
+@st.cache_data
+def _styled_metrics_html(metrics_pivot: pd.DataFrame) -> str:
+    """Render the metrics table with the best score per column highlighted.
+
+    The Styler walks every cell in Python, so the HTML is produced once and
+    reused instead of restyling the table on every rerun.
+    """
+    return (
+        metrics_pivot.style
+        .highlight_min(subset=[col for col in metrics_pivot.columns if col != "Model"],
+                       color='lightgreen', axis=0)
+        .format(precision=2)
+        .hide(axis="index")
+        .to_html()
+    )
+
+
+@st.cache_resource
+def _build_rmse_figure():
+    """Build the RMSE comparison chart once; it does not depend on any widget."""
+    # Imported here so plotly loads only when the figure is first built
+    import plotly.express as px
+
+    df = load_validation_metrics()
+    
+    # Create grouped bar chart in one Plotly Express call
+    colors = {'LightGBM': '#2ecc71', 'CatBoost': '#3498db', 'ElasticNet': '#95a5a6', 'SARIMAX': '#e74c3c'}
+
+    fig = px.bar(
+        df,
+        x="Horizon",
+        y="RMSE",
+        color="Model",
+        barmode='group',
+        color_discrete_map=colors,
+        text=df["RMSE"].round(2),
+        title="RMSE by Forecast Horizon (Lower is Better)",
+        labels={"Horizon": "Forecast Horizon (months)", "RMSE": "RMSE (MBPD)"},
+        template='plotly_white',
+        height=450,
+    )
+    fig.update_traces(textposition='outside')
+    fig.update_layout(
+        xaxis=dict(tickmode='array', tickvals=[1, 3, 6]),
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
 def render_modeling_page() -> None:
     st.set_page_config(page_title="Modeling", page_icon="🤖", layout="wide")
     st.title("🤖 Model Performance")
@@ -98,57 +163,16 @@ def render_modeling_page() -> None:
     # Single clear visualization
     st.header("📊 Model Comparison")
     
-    # Create grouped bar chart
-    fig = go.Figure()
-    
-    colors = {'LightGBM': '#2ecc71', 'CatBoost': '#3498db', 'ElasticNet': '#95a5a6', 'SARIMAX': '#e74c3c'}
-    
-    for model in df["Model"].unique():
-        model_data = df[df["Model"] == model]
-        fig.add_trace(go.Bar(
-            name=model,
-            x=model_data["Horizon"],
-            y=model_data["RMSE"],
-            text=model_data["RMSE"].round(2),
-            textposition='outside',
-            marker_color=colors.get(model, '#95a5a6')
-        ))
-    
-    fig.update_layout(
-        title="RMSE by Forecast Horizon (Lower is Better)",
-        xaxis_title="Forecast Horizon (months)",
-        yaxis_title="RMSE (MBPD)",
-        barmode='group',
-        height=450,
-        template='plotly_white',
-        xaxis=dict(tickmode='array', tickvals=[1, 3, 6]),
-        showlegend=True,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(_build_rmse_figure(), use_container_width=True)
     
     # Simple metrics table
     st.header("� Detailed Metrics")
     
-    # Pivot for cleaner view
-    metrics_pivot = df.pivot_table(
-        index="Model",
-        columns="Horizon",
-        values=["RMSE", "sMAPE"]
-    )
-    
-    # Flatten column names
-    metrics_pivot.columns = [f"{metric} ({horizon}m)" for metric, horizon in metrics_pivot.columns]
-    metrics_pivot = metrics_pivot.reset_index()
+    # Pivot for cleaner view; both it and the styled HTML below are cached
+    metrics_pivot = _build_metrics_pivot(df)
     
     # Highlight best performer
-    st.dataframe(
-        metrics_pivot.style.highlight_min(subset=[col for col in metrics_pivot.columns if col != "Model"], 
-                                         color='lightgreen', axis=0),
-        use_container_width=True,
-        hide_index=True
-    )
+    st.markdown(_styled_metrics_html(metrics_pivot), unsafe_allow_html=True)
     
     # MLflow tracking section
     st.header("🔧 MLOps: Experiment Tracking")
@@ -2,10 +2,60 @@
 
 from __future__ import annotations
 
-import plotly.graph_objects as go
+import numpy as np
 import streamlit as st
 
 
+@st.cache_resource
+def _build_importance_figure():
+    """Build the feature importance chart once; the SHAP summary is static."""
+    # Imported here so plotly loads only when the figure is first built
+    import plotly.graph_objects as go
+
+    # Feature importance data (from SHAP analysis).  Streamlit reruns this
+    # script on every interaction, so it lives here to be built only once.
+    feature_names = np.array([
+        "Brent Price (lag_1)",
+        "Saudi Production (lag_1)",
+        "Brent Price (roll_mean_3)",
+        "World Energy Demand",
+        "Saudi Production (lag_3)",
+        "Brent Price (lag_6)",
+        "Renewables Growth",
+        "Production (roll_mean_6)",
+        "Brent Price (roll_std_3)",
+        "World Assessment Code",
+    ])
+    feature_importance = np.array([38, 22, 15, 8, 6, 4, 3, 2, 1.5, 0.5], dtype=np.float32)
+    # Top 2 red, next 3 blue, rest grey
+    rank = np.arange(len(feature_names))
+    feature_colors = np.where(rank < 2, '#e74c3c', np.where(rank < 5, '#3498db', '#95a5a6'))
+
+    # Create horizontal bar chart from a plain dict trace and layout;
+    # np.flip gives reversed views for top-to-bottom display
+    importance = np.flip(feature_importance)
+    fig = go.Figure(
+        data=[dict(
+            type='bar',
+            y=np.flip(feature_names),
+            x=importance,
+            orientation='h',
+            text=np.char.mod("%g%%", importance),
+            textposition='outside',
+            marker=dict(color=np.flip(feature_colors)),
+            showlegend=False
+        )],
+        layout=dict(
+            title=dict(text="Feature Importance (% of Model Variance Explained)"),
+            xaxis=dict(title=dict(text="SHAP Importance (%)"), range=[0, float(feature_importance.max()) * 1.15]),
+            yaxis=dict(title=dict(text="")),
+            height=450,
+            template='plotly_white'
+        )
+    )
+    return fig
+
+
 def render_explainability_page() -> None:
     st.set_page_config(page_title="Explainability", page_icon="🔍", layout="wide")
     st.title("🔍 Model Explainability")
@@ -31,48 +81,7 @@ def render_explainability_page() -> None:
     # Visual feature importance ranking
     st.header("📊 Top 10 Feature Importance")
     
-    # Feature importance data (from SHAP analysis)
-    features = [
-        ("Brent Price (lag_1)", 38),
-        ("Saudi Production (lag_1)", 22),
-        ("Brent Price (roll_mean_3)", 15),
-        ("World Energy Demand", 8),
-        ("Saudi Production (lag_3)", 6),
-        ("Brent Price (lag_6)", 4),
-        ("Renewables Growth", 3),
-        ("Production (roll_mean_6)", 2),
-        ("Brent Price (roll_std_3)", 1.5),
-        ("World Assessment Code", 0.5),
-    ]
-    
-    feature_names = [f[0] for f in features]
-    importance_values = [f[1] for f in features]
-    
-    # Create horizontal bar chart
-    fig = go.Figure()
-    
-    colors = ['#e74c3c' if i < 2 else '#3498db' if i < 5 else '#95a5a6' for i in range(len(features))]
-    
-    fig.add_trace(go.Bar(
-        y=feature_names[::-1],  # Reverse for top-to-bottom display
-        x=importance_values[::-1],
-        orientation='h',
-        text=[f"{v}%" for v in importance_values[::-1]],
-        textposition='outside',
-        marker_color=colors[::-1],
-        showlegend=False
-    ))
-    
-    fig.update_layout(
-        title="Feature Importance (% of Model Variance Explained)",
-        xaxis_title="SHAP Importance (%)",
-        yaxis_title="",
-        height=450,
-        template='plotly_white',
-        xaxis=dict(range=[0, max(importance_values) * 1.15])
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(_build_importance_figure(), use_container_width=True)
     
     # Feature categories breakdown
     st.header("📂 Feature Categories")
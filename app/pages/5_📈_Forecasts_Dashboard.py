@@ -4,36 +4,58 @@ from __future__ import annotations
 
 import datetime as dt
 import logging
-import sys
-from pathlib import Path
-from typing import Dict, List
+from typing import List, Tuple
 
+import orjson
 import pandas as pd
-import plotly.graph_objects as go
 import streamlit as st
-import requests
-
-# Add parent directory to path for imports
-root_dir = Path(__file__).resolve().parents[1]
-if str(root_dir / "src") not in sys.path:
-    sys.path.insert(0, str(root_dir / "src"))
-
-from config import PORT_API
-
+from _api import get_api_client
 
 logger = logging.getLogger(__name__)
 
-API_URL = f"http://localhost:{PORT_API}"
 
-
-def call_predict(dates: List[str], scenario: Dict[str, List[float]]) -> List[float]:
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_forecast(
+    dates: Tuple[str, ...], brent: float, renew_growth: float, world_growth: float
+) -> Tuple[float, ...]:
+    """Request a forecast for one scenario; identical inputs are served from cache.
+
+    Errors propagate so that failed calls are not cached.
+    """
+    horizon = len(dates)
+    scenario = {
+        "brent_price": [brent] * horizon,
+        "renewables_installed_capacity": [renew_growth] * horizon,
+        "world_primary_energy_consumption": [world_growth] * horizon,
+    }
+    # orjson encodes the payload and decodes the float list faster than stdlib json
+    resp = get_api_client().post(
+        "/predict",
+        content=orjson.dumps({"dates": list(dates), "scenario": scenario}),
+        headers={"Content-Type": "application/json"},
+        timeout=10.0,
+    )
+    resp.raise_for_status()
+    return tuple(orjson.loads(resp.content).get("predictions", []))
+
+
+def call_predict(
+    dates: List[str], brent: float, renew_growth: float, world_growth: float
+) -> Tuple[float, ...]:
     try:
-        resp = requests.post(f"{API_URL}/predict", json={"dates": dates, "scenario": scenario})
-        resp.raise_for_status()
-        return resp.json().get("predictions", [])
+        return _fetch_forecast(tuple(dates), brent, renew_growth, world_growth)
     except Exception as exc:
         logger.error("Forecast API call failed: %s", exc)
-        return []
+        return ()
+
+
+@st.cache_data(show_spinner=False)
+def _forecast_csv(dates: Tuple[str, ...], preds: Tuple[float, ...]) -> str:
+    """Render a forecast as CSV once per unique result.
+
+    ``dates`` are already ISO strings, so no frame copy or strftime is needed.
+    """
+    return pd.DataFrame({"Date": dates, "Forecast (MBPD)": preds}).to_csv(index=False)
 
 
 def render_dashboard() -> None:
@@ -55,11 +77,11 @@ def render_dashboard() -> None:
         )
         horizon = st.slider("Horizon (months)", min_value=1, max_value=12, value=6, help="Number of months to forecast")
         
-        dates = []
-        for i in range(horizon):
-            year = start_date.year + (start_date.month + i - 1) // 12
-            month = (start_date.month + i - 1) % 12 + 1
-            dates.append(dt.date(year, month, 1).isoformat())
+        # First day of each forecast month; the index is reused for the chart
+        month_starts = pd.date_range(
+            pd.Timestamp(start_date).replace(day=1), periods=horizon, freq="MS"
+        )
+        dates = month_starts.strftime("%Y-%m-%d").tolist()
 
         st.subheader("🎛️ Scenario Inputs")
         
@@ -95,12 +117,7 @@ def render_dashboard() -> None:
     with col_output:
         if generate_btn:
             with st.spinner("Generating forecast..."):
-                scenario = {
-                    "brent_price": [brent] * horizon,
-                    "renewables_installed_capacity": [renew_growth] * horizon,
-                    "world_primary_energy_consumption": [world_growth] * horizon,
-                }
-                preds = call_predict(dates, scenario)
+                preds = call_predict(dates, brent, renew_growth, world_growth)
                 
                 if preds:
                     st.subheader("📊 Forecast Results")
@@ -119,51 +136,53 @@ def render_dashboard() -> None:
                                  delta=f"{preds[-1] - preds[0]:+.0f}")
                     
                     # Create enhanced forecast chart
+                    # Date_str keeps the ISO strings formatted once above for
+                    # the table and CSV export
                     df = pd.DataFrame({
-                        "Date": pd.to_datetime(dates),
+                        "Date": month_starts,
+                        "Date_str": dates,
                         "Production": preds
                     })
                     
-                    fig = go.Figure()
+                    # Deferred until a forecast is actually charted
+                    import plotly.graph_objects as go
                     
-                    fig.add_trace(go.Scatter(
-                        x=df["Date"],
-                        y=df["Production"],
-                        mode='lines+markers',
-                        name='Forecast',
-                        line=dict(color='#2ecc71', width=3),
-                        marker=dict(size=8),
-                        fill='tozeroy',
-                        fillcolor='rgba(46, 204, 113, 0.1)'
-                    ))
-                    
-                    fig.update_layout(
-                        title=f"Saudi Production Forecast ({horizon}-Month Horizon)",
-                        xaxis_title="Date",
-                        yaxis_title="Production (MBPD)",
-                        height=400,
-                        template='plotly_white',
-                        hovermode='x unified'
+                    fig = go.Figure(
+                        data=[dict(
+                            type='scattergl',
+                            x=df["Date"],
+                            y=df["Production"],
+                            mode='lines+markers',
+                            name='Forecast',
+                            line=dict(color='#2ecc71', width=3),
+                            marker=dict(size=8),
+                            fill='tozeroy',
+                            fillcolor='rgba(46, 204, 113, 0.1)'
+                        )],
+                        layout=dict(
+                            title=dict(text=f"Saudi Production Forecast ({horizon}-Month Horizon)"),
+                            xaxis=dict(title=dict(text="Date")),
+                            yaxis=dict(title=dict(text="Production (MBPD)")),
+                            height=400,
+                            template='plotly_white',
+                            hovermode='x unified'
+                        )
                     )
                     
                     st.plotly_chart(fig, use_container_width=True)
                     
                     # Data table and download
                     with st.expander("📋 View forecast data"):
-                        display_df = df.copy()
-                        display_df["Date"] = display_df["Date"].dt.strftime("%Y-%m")
-                        display_df["Production (MBPD)"] = display_df["Production"].round(1)
-                        st.dataframe(display_df[["Date", "Production (MBPD)"]], 
-                                   use_container_width=True, hide_index=True)
+                        display_df = pd.DataFrame({
+                            "Date": df["Date_str"].str.slice(0, 7),
+                            "Production (MBPD)": df["Production"].round(1),
+                        })
+                        st.dataframe(display_df, use_container_width=True, hide_index=True)
                     
                     # Download button
-                    csv_data = df.copy()
-                    csv_data["Date"] = csv_data["Date"].dt.strftime("%Y-%m-%d")
-                    csv_data.columns = ["Date", "Forecast (MBPD)"]
-                    
                     st.download_button(
                         label="⬇️ Download CSV",
-                        data=csv_data.to_csv(index=False),
+                        data=_forecast_csv(tuple(df["Date_str"]), preds),
                         file_name=f"saudi_forecast_{dt.date.today()}.csv",
                         mime="text/csv",
                         use_container_width=True
@@ -4,13 +4,14 @@
 import sys
 from pathlib import Path
 
-# Add necessary paths BEFORE any imports
+# Add necessary paths BEFORE any imports (skipping any already present)
 root_dir = Path(__file__).parent
-sys.path.insert(0, str(root_dir / "src"))
-sys.path.insert(0, str(root_dir))
+for path in (root_dir / "src", root_dir):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
 
 # Now import and run
 if __name__ == "__main__":
-    import uvicorn
-    # Use the module path with proper setup
-    uvicorn.run("api.main:app", host="0.0.0.0", port=8000, reload=False)
+    from api.main import run
+
+    run()
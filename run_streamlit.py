@@ -4,11 +4,12 @@
 import sys
 from pathlib import Path
 
-# Add necessary paths
+# Add necessary paths (skipping any already present); the pages themselves
+# rely on app/_pathboot.py, which Python imports only once per process
 root_dir = Path(__file__).parent
-sys.path.insert(0, str(root_dir / "src"))
-sys.path.insert(0, str(root_dir / "app"))
-sys.path.insert(0, str(root_dir))
+for path in (root_dir / "src", root_dir / "app", root_dir):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
 
 if __name__ == "__main__":
     import streamlit.web.cli as stcli
@@ -18,6 +18,12 @@ RAW_DATA_DIR = DATA_DIR / "raw"
 INTERIM_DATA_DIR = DATA_DIR / "interim"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
 
+# Feature matrix written by build_features and read for training and inference
+FEATURES_PATH = PROCESSED_DATA_DIR / "features.parquet"
+
+# Float dtype the stored feature matrix is downcast to ("float64" keeps full precision)
+FEATURES_FLOAT_DTYPE: str = os.getenv("FEATURES_FLOAT_DTYPE", "float32")
+
 # MLflow configuration
 MLFLOW_TRACKING_URI: str = os.getenv("MLFLOW_TRACKING_URI", "http://mlflow:5000")
 MLFLOW_EXPERIMENT_NAME: str = os.getenv("MLFLOW_EXPERIMENT_NAME", "gcc_oil_forecast")
@@ -27,6 +33,19 @@ MODEL_REGISTRY_STAGE: str = os.getenv("MODEL_REGISTRY_STAGE", "Production")
 PORT_API: int = int(os.getenv("PORT_API", "8000"))
 PORT_APP: int = int(os.getenv("PORT_APP", "8501"))
 
+# Number of uvicorn worker processes for the production API entrypoint
+UVICORN_WORKERS: int = int(os.getenv("UVICORN_WORKERS", "4"))
+
+# In-memory cache of /predict responses (entries, seconds to live)
+PREDICT_CACHE_SIZE: int = int(os.getenv("PREDICT_CACHE_SIZE", "512"))
+PREDICT_CACHE_TTL: int = int(os.getenv("PREDICT_CACHE_TTL", "300"))
+
+# Seconds /model/{h}/info metadata is cached in memory and by HTTP clients
+MODEL_INFO_MAX_AGE: int = int(os.getenv("MODEL_INFO_MAX_AGE", "60"))
+
+# Processes training (horizon, model) pairs in parallel; 1 trains sequentially
+TRAIN_MAX_WORKERS: int = int(os.getenv("TRAIN_MAX_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+
 # Default modelling hyperparameters (can be overridden via CLI or environment)
 LIGHTGBM_PARAMS = {
     "n_estimators": int(os.getenv("LGBM_N_ESTIMATORS", "500")),
@@ -0,0 +1,133 @@
+"""Compiled running-window kernels used by :func:`transforms.add_rolling_features`.
+
+Each kernel makes a single O(n) pass over a float64 array and reproduces
+``Series.rolling(window).<stat>()`` with the default ``min_periods=window``:
+the result is NaN until ``window`` observations are available and whenever
+the window contains a NaN.  Importing this module raises ImportError when
+numba is not installed; callers fall back to pandas in that case.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit
+def roll_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling mean maintained as a running sum."""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    n_nan = 0
+    for i in range(n):
+        x = values[i]
+        if np.isnan(x):
+            n_nan += 1
+        else:
+            total += x
+        if i >= window:
+            y = values[i - window]
+            if np.isnan(y):
+                n_nan -= 1
+            else:
+                total -= y
+        if i >= window - 1 and n_nan == 0:
+            out[i] = total / window
+    return out
+
+
+@njit
+def roll_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample standard deviation (ddof=1) using Welford updates.
+
+    Each step adds the entering value and removes the leaving one from the
+    running mean and sum of squared deviations.  As in pandas, a window of
+    identical values yields exactly 0 and tiny negative variances from
+    rounding are clamped to 0.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    mean = 0.0
+    ssq = 0.0
+    nobs = 0
+    n_nan = 0
+    same_run = 0
+    prev = np.nan
+    for i in range(n):
+        x = values[i]
+        if np.isnan(x):
+            n_nan += 1
+            same_run = 0
+        else:
+            nobs += 1
+            delta = x - mean
+            mean += delta / nobs
+            ssq += delta * (x - mean)
+            same_run = same_run + 1 if x == prev else 1
+        prev = x
+        if i >= window:
+            y = values[i - window]
+            if np.isnan(y):
+                n_nan -= 1
+            else:
+                nobs -= 1
+                if nobs == 0:
+                    mean = 0.0
+                    ssq = 0.0
+                else:
+                    delta = y - mean
+                    mean -= delta / nobs
+                    ssq -= delta * (y - mean)
+        if i >= window - 1 and n_nan == 0 and nobs > 1:
+            if same_run >= nobs:
+                out[i] = 0.0
+            else:
+                out[i] = np.sqrt(max(ssq, 0.0) / (nobs - 1))
+    return out
+
+
+@njit
+def _roll_extreme(values: np.ndarray, window: int, is_max: bool) -> np.ndarray:
+    """Rolling min or max using a monotonic deque of indices."""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    n_nan = 0
+    for i in range(n):
+        x = values[i]
+        if np.isnan(x):
+            n_nan += 1
+        else:
+            while tail > head:
+                last = values[deque[tail - 1]]
+                if (last <= x) if is_max else (last >= x):
+                    tail -= 1
+                else:
+                    break
+            deque[tail] = i
+            tail += 1
+        if i >= window and np.isnan(values[i - window]):
+            n_nan -= 1
+        while tail > head and deque[head] <= i - window:
+            head += 1
+        if i >= window - 1 and n_nan == 0:
+            out[i] = values[deque[head]]
+    return out
+
+
+@njit
+def roll_min(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling minimum."""
+    return _roll_extreme(values, window, False)
+
+
+@njit
+def roll_max(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling maximum."""
+    return _roll_extreme(values, window, True)
+
+
+KERNELS = {"mean": roll_mean, "std": roll_std, "min": roll_min, "max": roll_max}
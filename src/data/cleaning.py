@@ -11,6 +11,7 @@ from __future__ import annotations
 import logging
 from typing import Iterable
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -24,11 +25,26 @@ def _standardise_columns(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with normalised column names.
     """
-    df = df.copy()
+    # A shallow copy gets its own column index without duplicating the data
+    df = df.copy(deep=False)
     df.columns = [c.strip().lower().replace(" ", "_").replace("/", "_") for c in df.columns]
     return df
 
 
+def _isin_normalised(values: pd.Series, allowed: Iterable[str], upper: bool = False) -> np.ndarray:
+    """Return a mask of ``values`` whose lower‑ (or upper‑) cased form is in ``allowed``.
+
+    The values are factorised first so each distinct string is case‑normalised
+    once, rather than once per row.  Missing values never match.
+    """
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Index(uniques)
+    normalised = uniques.str.upper() if upper else uniques.str.lower()
+    # Append False so the missing-value code (-1) maps to no match
+    keep = np.append(normalised.isin(list(allowed)), False)
+    return keep[codes]
+
+
 def clean_world_primary_energy(df: pd.DataFrame) -> pd.DataFrame:
     """Clean the world primary energy dataset.
 
@@ -38,18 +54,19 @@ def clean_world_primary_energy(df: pd.DataFrame) -> pd.DataFrame:
     df = _standardise_columns(df)
     # Parse a date column if present.  Some OWID tables use 'year', others use 'time_period'.
     if "year" in df.columns:
-        df["date"] = pd.to_datetime(df["year"].astype(str) + "-01-01")
+        # format="%Y" parses integer years straight to January 1st
+        df["date"] = pd.to_datetime(df["year"], format="%Y", cache=True)
     elif "time_period" in df.columns:
         # time_period may be year-month format (YYYY-MM).  Coerce to datetime.
         df["date"] = pd.to_datetime(df["time_period"], errors="coerce")
     # Restrict to GCC countries if present (ref_area or country codes)
     gcc_countries = ["saudi arabia", "united arab emirates", "kuwait", "qatar", "oman", "bahrain"]
     if "country" in df.columns:
-        df = df[df["country"].str.lower().isin(gcc_countries)]
+        df = df[_isin_normalised(df["country"], gcc_countries)]
     elif "ref_area" in df.columns:
         # Use ISO alpha-2 codes for GCC members
         gcc_codes = {"SA", "AE", "KW", "QA", "OM", "BH"}
-        df = df[df["ref_area"].str.upper().isin(gcc_codes)]
+        df = df[_isin_normalised(df["ref_area"], gcc_codes, upper=True)]
     # Convert obs_value column to numeric if present
     for col in ["obs_value", "value"]:
         if col in df.columns:
@@ -65,10 +82,10 @@ def clean_renewables(df: pd.DataFrame) -> pd.DataFrame:
     df = _standardise_columns(df)
     # Parse a date column if present.  Accept 'year' or 'time_period'.
     if "year" in df.columns:
-        df["date"] = pd.to_datetime(df["year"].astype(str) + "-01-01")
+        df["date"] = pd.to_datetime(df["year"], format="%Y", cache=True)
     elif "time_period" in df.columns:
-        # If time_period is numeric (year), convert to string and append '-01-01' for annual frequency
-        df["date"] = pd.to_datetime(df["time_period"].astype(str) + "-01-01", errors="coerce")
+        # time_period holds the year for this annual table
+        df["date"] = pd.to_datetime(df["time_period"], format="%Y", errors="coerce", cache=True)
     return df
 
 
@@ -83,11 +100,10 @@ def clean_saudi_crude(df: pd.DataFrame) -> pd.DataFrame:
     year_cols = [c for c in df.columns if "year" in c]
     prod_cols = [c for c in df.columns if "production" in c or "output" in c]
     if year_cols:
-        df["date"] = pd.to_datetime(df[year_cols[0]].astype(str) + "-01-01")
-    # Forward fill missing production values
-    for col in prod_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-        df[col] = df[col].ffill()
+        df["date"] = pd.to_datetime(df[year_cols[0]], format="%Y", cache=True)
+    # Convert and forward fill all production columns in one assignment
+    if prod_cols:
+        df[prod_cols] = df[prod_cols].apply(pd.to_numeric, errors="coerce").ffill()
     return df
 
 
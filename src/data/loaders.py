@@ -7,16 +7,139 @@ differences and provide Pandas DataFrames with consistent schemas.
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
+import os
 from pathlib import Path
+import threading
 import zipfile
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None  # type: ignore
+
+try:
+    import python_calamine  # noqa: F401
+except ImportError:
+    python_calamine = None  # type: ignore
+
 
 logger = logging.getLogger(__name__)
 
+# The multithreaded pyarrow parser is used when available; the C engine otherwise
+CSV_ENGINE = "pyarrow" if pyarrow is not None else "c"
+
+# The Rust calamine reader (pandas >= 2.2) is much faster than xlrd/openpyxl;
+# None lets pandas pick its default engine for the file type
+_PANDAS_HAS_CALAMINE = tuple(int(p) for p in pd.__version__.split(".")[:2]) >= (2, 2)
+EXCEL_ENGINE = "calamine" if python_calamine is not None and _PANDAS_HAS_CALAMINE else None
+
+# Sub-directory of the interim data directory holding cached loader outputs
+PARQUET_CACHE_SUBDIR = "loader_cache"
+
+# Recorded with every cached frame; bump it when a loader's parsing changes in
+# a way its cache parameters do not capture, to invalidate existing caches
+LOADER_CACHE_VERSION = 1
+
+# Columns of the SAMA export the pipeline uses; the parser skips the others
+SAUDI_CRUDE_COLUMNS = ["Year", "Production Indicator", "Value"]
+
+
+# In-process copies of loader outputs: resolved raw path -> ((mtime_ns, size), frame)
+_MEMORY_CACHE: Dict[Path, Tuple[Tuple[int, int], pd.DataFrame]] = {}
+
+
+def _atomic_write(path: Path, write: Callable[[Path], Any]) -> None:
+    """Call ``write`` on a temporary sibling of ``path``, then move it into place.
+
+    Processes sharing the cache directory (e.g. pytest-xdist workers) never see
+    a partially written file.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _parquet_cache(
+    raw_name: str, *params: Any
+) -> Callable[[Callable[[Path], pd.DataFrame]], Callable[[Path], pd.DataFrame]]:
+    """Cache a raw dataset loader's output in memory and as Parquet.
+
+    Within a process, repeated loads of an unchanged raw file return a copy of
+    the frame kept in memory, so callers are free to mutate the result.  On
+    disk the cache lives in ``<raw_dir>/../interim/loader_cache``
+    (``INTERIM_DATA_DIR`` for the standard layout) and is keyed on the raw
+    file's modification time and size, ``LOADER_CACHE_VERSION`` and
+    ``params``, recorded in a JSON sidecar.  A stale or missing entry falls
+    back to the wrapped loader and refreshes the cache; both files are
+    replaced atomically since several processes may share the directory.
+    Parquet caching is skipped when pyarrow is not installed or the frame
+    cannot be stored as Parquet.
+
+    Args:
+        raw_name: File name of the raw dataset within ``raw_dir``.
+        params: Parsing options the loader applies (e.g. selected columns);
+            changing them invalidates the on-disk cache.
+    """
+
+    def decorator(loader: Callable[[Path], pd.DataFrame]) -> Callable[[Path], pd.DataFrame]:
+        def load_through_parquet(raw_dir: Path, raw_path: Path, stat: os.stat_result) -> pd.DataFrame:
+            if pyarrow is None:
+                return loader(raw_dir)
+            stamp = {
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "version": LOADER_CACHE_VERSION,
+                "params": repr(params),
+            }
+            cache_dir = raw_path.parent.parent / "interim" / PARQUET_CACHE_SUBDIR
+            cache_path = cache_dir / f"{raw_name}.parquet"
+            meta_path = cache_dir / f"{raw_name}.meta.json"
+            try:
+                if cache_path.exists() and json.loads(meta_path.read_text()) == stamp:
+                    logger.info("Loading %s from Parquet cache", raw_name)
+                    return pd.read_parquet(cache_path, engine="pyarrow")
+            except (OSError, ValueError) as exc:
+                logger.warning("Ignoring unreadable cache for %s: %s", raw_name, exc)
+            df = loader(raw_dir)
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                _atomic_write(
+                    cache_path,
+                    lambda path: df.to_parquet(path, engine="pyarrow", compression="zstd"),
+                )
+                _atomic_write(meta_path, lambda path: path.write_text(json.dumps(stamp)))
+            except (OSError, ValueError, TypeError, pyarrow.ArrowException) as exc:
+                logger.warning("Could not cache %s as Parquet: %s", raw_name, exc)
+            return df
+
+        @functools.wraps(loader)
+        def wrapper(raw_dir: Path) -> pd.DataFrame:
+            raw_path = Path(raw_dir) / raw_name
+            if not raw_path.exists():
+                return loader(raw_dir)
+            stat = raw_path.stat()
+            key = raw_path.resolve()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = _MEMORY_CACHE.get(key)
+            if cached is None or cached[0] != stamp:
+                df = load_through_parquet(raw_dir, raw_path, stat)
+                cached = _MEMORY_CACHE[key] = (stamp, df)
+            return cached[1].copy()
+
+        return wrapper
+
+    return decorator
+
 
 def load_zip_csv(zip_path: Path, csv_name: Optional[str] = None) -> pd.DataFrame:
     """Load a CSV file from within a ZIP archive.
@@ -28,6 +151,9 @@ def load_zip_csv(zip_path: Path, csv_name: Optional[str] = None) -> pd.DataFrame
 
     Returns:
         DataFrame containing the CSV contents.
+
+    With pyarrow installed the member is parsed by its multithreaded reader,
+    which already splits the input into blocks and parses them in parallel.
     """
     with zipfile.ZipFile(zip_path, "r") as zf:
         names = [name for name in zf.namelist() if name.endswith(".csv")]
@@ -36,8 +162,10 @@ def load_zip_csv(zip_path: Path, csv_name: Optional[str] = None) -> pd.DataFrame
         target = csv_name or names[0]
         if target not in names:
             raise FileNotFoundError(f"{target} not found in {zip_path}; available: {names}")
-        with zf.open(target) as f:
-            df = pd.read_csv(f)
+        # Stream the member into the parser rather than holding its
+        # decompressed bytes in memory alongside the parsed frame
+        with zf.open(target) as member:
+            df = pd.read_csv(member, engine=CSV_ENGINE)
     logger.info("Loaded %s from %s", target, zip_path.name)
     return df
 
@@ -45,6 +173,9 @@ def load_zip_csv(zip_path: Path, csv_name: Optional[str] = None) -> pd.DataFrame
 def load_csv(path: Path, **read_csv_kwargs) -> pd.DataFrame:
     """Load a CSV file using pandas.read_csv.
 
+    The pyarrow engine is used by default when installed; pass ``engine`` to
+    override it.
+
     Args:
         path: Path to the CSV file.
         **read_csv_kwargs: Additional keyword arguments passed to read_csv.
@@ -53,14 +184,16 @@ def load_csv(path: Path, **read_csv_kwargs) -> pd.DataFrame:
         DataFrame with the file contents.
     """
     logger.info("Loading CSV %s", path.name)
+    read_csv_kwargs.setdefault("engine", CSV_ENGINE)
     return pd.read_csv(path, **read_csv_kwargs)
 
 
 def load_excel(path: Path, sheet_name: int | str | None = 0, **read_excel_kwargs) -> pd.DataFrame:
     """Load an Excel file (.xls or .xlsx).
 
-    Pandas requires either xlrd or openpyxl depending on the file format.  The
-    appropriate engine is inferred automatically if the packages are installed.
+    The calamine engine is used when python-calamine is installed; otherwise
+    pandas requires either xlrd or openpyxl depending on the file format and
+    infers the appropriate engine.  Pass ``engine`` to override.
 
     Args:
         path: Path to the Excel file.
@@ -72,12 +205,14 @@ def load_excel(path: Path, sheet_name: int | str | None = 0, **read_excel_kwargs
     """
     try:
         logger.info("Loading Excel %s (sheet: %s)", path.name, sheet_name)
+        read_excel_kwargs.setdefault("engine", EXCEL_ENGINE)
         return pd.read_excel(path, sheet_name=sheet_name, **read_excel_kwargs)
     except ImportError as exc:
-        logger.error("Unable to read %s.  Install xlrd or openpyxl to proceed.", path.name)
+        logger.error("Unable to read %s.  Install python-calamine, xlrd or openpyxl to proceed.", path.name)
         raise exc
 
 
+@_parquet_cache("world_primary_csv.zip")
 def load_world_primary_energy(raw_dir: Path) -> pd.DataFrame:
     """Load the world primary energy dataset from a ZIP archive.
 
@@ -87,6 +222,7 @@ def load_world_primary_energy(raw_dir: Path) -> pd.DataFrame:
     return load_zip_csv(zip_path)
 
 
+@_parquet_cache("renewable-energy-installed-capacity-and-electricity-production.csv")
 def load_renewables(raw_dir: Path) -> pd.DataFrame:
     """Load the renewable energy installed capacity and electricity production dataset.
 
@@ -105,16 +241,21 @@ def load_renewables(raw_dir: Path) -> pd.DataFrame:
     return load_csv(csv_path, sep=";")
 
 
+@_parquet_cache(
+    "saudi-crude-oil-production-from-sama-annual-statistics-2015-dec.csv", SAUDI_CRUDE_COLUMNS
+)
 def load_saudi_crude(raw_dir: Path) -> pd.DataFrame:
     """Load the Saudi crude oil production dataset from a CSV file.
 
     The raw file uses semicolon delimiters.  We explicitly set ``sep=';'`` to
-    correctly parse the columns.
+    correctly parse the columns.  Only `SAUDI_CRUDE_COLUMNS` are read; the
+    periodicity and date-string columns are never used downstream.
     """
     csv_path = raw_dir / "saudi-crude-oil-production-from-sama-annual-statistics-2015-dec.csv"
-    return load_csv(csv_path, sep=";")
+    return load_csv(csv_path, sep=";", usecols=SAUDI_CRUDE_COLUMNS)
 
 
+@_parquet_cache("RBRTEm.xls")
 def load_brent_monthly(raw_dir: Path) -> pd.DataFrame:
     """Load the monthly Brent spot price dataset from an Excel file.
 
@@ -125,6 +266,7 @@ def load_brent_monthly(raw_dir: Path) -> pd.DataFrame:
     return load_excel(excel_path, sheet_name='Data 1', skiprows=2)
 
 
+@_parquet_cache("RBRTEd.xls")
 def load_brent_daily(raw_dir: Path) -> pd.DataFrame:
     """Load the daily Brent spot price dataset from an Excel file.
     """
@@ -2,13 +2,38 @@
 
 This module contains generic functions for resampling time series, creating
 lags and rolling statistics.  These helpers are used in the feature
-engineering pipeline.
+engineering pipeline.  `add_lag_rolling_features` builds the lags and rolling
+statistics of one or more columns together in a single preallocated matrix;
+the feature build and the forecaster both use it.
 """
 
 from __future__ import annotations
 
+import functools
+
+import numpy as np
 import pandas as pd
-from typing import List
+from typing import Callable, Dict, List
+
+try:
+    from . import _rolling_numba
+except ImportError:  # numba not installed; fall back to pandas rolling
+    _rolling_numba = None
+
+
+def _pandas_rolling(stat: str, values: np.ndarray, window: int) -> np.ndarray:
+    return getattr(pd.Series(values).rolling(window), stat)().to_numpy()
+
+
+# Rolling kernel for each supported stat, resolved once at import
+_ROLL_FN: Dict[str, Callable[[np.ndarray, int], np.ndarray]] = (
+    dict(_rolling_numba.KERNELS)
+    if _rolling_numba is not None
+    else {
+        stat: functools.partial(_pandas_rolling, stat)
+        for stat in ("mean", "std", "min", "max")
+    }
+)
 
 
 def resample_to_month_start(
@@ -25,22 +50,64 @@ def resample_to_month_start(
     Returns:
         DataFrame indexed by the first day of each month with aggregated columns.
     """
-    df = df.copy()
-    df[date_col] = pd.to_datetime(df[date_col])
-    df = df.set_index(date_col)
-    
+    # Index only the value columns by date; the input frame is left untouched
+    index = pd.DatetimeIndex(pd.to_datetime(df[date_col]), name=date_col)
+    values = df[value_cols].set_axis(index)
+
     # Special handling for forward fill
     if how == "ffill":
         # Resample to monthly and forward fill
-        agg_df = df[value_cols].resample("MS").ffill()
+        agg_df = values.resample("MS").ffill()
     else:
         # Use standard aggregation methods
-        agg_df = getattr(df[value_cols].resample("MS"), how)()
+        agg_df = getattr(values.resample("MS"), how)()
     
     agg_df = agg_df.reset_index()
     return agg_df
 
 
+def _with_columns(df: pd.DataFrame, columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """Return ``df`` with ``columns`` attached in a single concat.
+
+    Columns whose names already exist are overwritten in place, so their
+    position is preserved; new columns are appended in the given order.
+    """
+    new = {}
+    for name, values in columns.items():
+        if name in df.columns:
+            df[name] = values
+        else:
+            new[name] = values
+    if not new:
+        return df
+    return pd.concat([df, pd.DataFrame(new, index=df.index)], axis=1)
+
+
+def _shift_into(out: np.ndarray, values: np.ndarray, lag: int) -> None:
+    """Write ``values`` shifted by ``lag`` positions into ``out``, NaN-filling vacated slots."""
+    n = len(values)
+    k = min(abs(lag), n)
+    if lag >= 0:
+        out[:k] = np.nan
+        out[k:] = values[: n - k]
+    else:
+        out[: n - k] = values[k:]
+        out[n - k :] = np.nan
+
+
+def _attach_block(df: pd.DataFrame, names: List[str], block: np.ndarray) -> pd.DataFrame:
+    """Attach the columns of a 2-D float ``block`` to ``df`` under ``names``.
+
+    When the names are new and distinct the block is wrapped without copying
+    and concatenated once; otherwise the columns go through `_with_columns`,
+    which overwrites existing names in place.
+    """
+    if len(set(names)) == len(names) and not df.columns.isin(names).any():
+        features = pd.DataFrame(block, columns=names, index=df.index, copy=False)
+        return pd.concat([df, features], axis=1)
+    return _with_columns(df, {name: block[:, k] for k, name in enumerate(names)})
+
+
 def add_lag_features(
     df: pd.DataFrame, value_col: str, lags: List[int]
 ) -> pd.DataFrame:
@@ -54,9 +121,31 @@ def add_lag_features(
     Returns:
         DataFrame with new columns `{value_col}_lag_{lag}` for each lag.
     """
-    for lag in lags:
-        df[f"{value_col}_lag_{lag}"] = df[value_col].shift(lag)
-    return df
+    series = df[value_col]
+    names = [f"{value_col}_lag_{lag}" for lag in lags]
+    if series.dtype.kind in "iuf" and 0 not in lags:
+        # Integers are upcast to float64 for the NaN fill, as Series.shift does
+        values = series.to_numpy()
+        if values.dtype.kind != "f":
+            values = values.astype(np.float64)
+        # Every lag is written into one column-major block and attached at once
+        block = np.empty((len(values), len(lags)), dtype=values.dtype, order="F")
+        for k, lag in enumerate(lags):
+            _shift_into(block[:, k], values, lag)
+        return _attach_block(df, names, block)
+    return _with_columns(df, {name: series.shift(lag) for name, lag in zip(names, lags, strict=True)})
+
+
+def _roll_specs(windows: List[int], stats: List[str]) -> List[tuple]:
+    """Return ``(window, kernel, name suffix)`` for each rolling feature, in column order."""
+    for stat in stats:
+        if stat not in _ROLL_FN:
+            raise ValueError(f"Unsupported stat: {stat}")
+    return [
+        (window, _ROLL_FN[stat], f"_roll_{stat}_{window}")
+        for window in windows
+        for stat in stats
+    ]
 
 
 def add_rolling_features(
@@ -64,6 +153,12 @@ def add_rolling_features(
 ) -> pd.DataFrame:
     """Add rolling window statistics to a DataFrame.
 
+    With numba installed the statistics come from the O(n) kernels in
+    `_rolling_numba` (running sums, Welford variance, monotonic deques for
+    min/max); otherwise pandas rolling is used.  The choice is made once at
+    import, not per call by input size, so a column's features never change in
+    the last bits with the length of the frame they were computed on.
+
     Args:
         df: Input DataFrame sorted by date ascending.
         value_col: Column for which to compute rolling features.
@@ -76,18 +171,61 @@ def add_rolling_features(
     """
     if stats is None:
         stats = ["mean", "std"]
-    for window in windows:
-        for stat in stats:
-            col_name = f"{value_col}_roll_{stat}_{window}"
-            roll = df[value_col].rolling(window)
-            if stat == "mean":
-                df[col_name] = roll.mean()
-            elif stat == "std":
-                df[col_name] = roll.std()
-            elif stat == "min":
-                df[col_name] = roll.min()
-            elif stat == "max":
-                df[col_name] = roll.max()
-            else:
-                raise ValueError(f"Unsupported stat: {stat}")
-    return df
+    specs = _roll_specs(windows, stats)
+    values = df[value_col].to_numpy(dtype=np.float64)
+    rolled = {value_col + suffix: kernel(values, window) for window, kernel, suffix in specs}
+    return _with_columns(df, rolled)
+
+
+def add_lag_rolling_features(
+    df: pd.DataFrame,
+    value_cols: List[str],
+    lags: List[int],
+    windows: List[int],
+    stats: List[str] | None = None,
+) -> pd.DataFrame:
+    """Add lag and rolling features for several columns in one pass.
+
+    Equivalent to calling :func:`add_lag_features` and then
+    :func:`add_rolling_features` for each column of ``value_cols`` in turn,
+    but every feature is written into one preallocated column-major float64
+    matrix and attached to ``df`` at the end.  A source column that an earlier
+    column's features overwrote (e.g. ``x_lag_1`` when ``x`` is listed first)
+    is read from the freshly computed values, as in the sequential version.
+
+    Args:
+        df: Input DataFrame sorted by date ascending.
+        value_cols: Columns from which to create features, in order.
+        lags: List of integer lag values (in months).
+        windows: List of window sizes (in months).
+        stats: Rolling statistics to compute.  If None, defaults to
+            ['mean', 'std'].
+
+    Returns:
+        DataFrame with the lag and rolling columns of every value column.
+    """
+    if stats is None:
+        stats = ["mean", "std"]
+    # Name suffixes and kernels are resolved once, outside the column loop
+    lag_specs = [(lag, f"_lag_{lag}") for lag in lags]
+    roll_specs = _roll_specs(windows, stats)
+    width = len(lag_specs) + len(roll_specs)
+    out = np.empty((len(df), len(value_cols) * width), dtype=np.float64, order="F")
+    written: Dict[str, int] = {}
+    j = 0
+    for col in value_cols:
+        if col in written:
+            values = out[:, written[col]]
+        else:
+            values = df[col].to_numpy(dtype=np.float64)
+        for lag, suffix in lag_specs:
+            _shift_into(out[:, j], values, lag)
+            written[col + suffix] = j
+            j += 1
+        for window, kernel, suffix in roll_specs:
+            out[:, j] = kernel(values, window)
+            written[col + suffix] = j
+            j += 1
+    if len(written) == out.shape[1]:
+        return _attach_block(df, list(written), out)
+    return _with_columns(df, {name: out[:, k] for name, k in written.items()})
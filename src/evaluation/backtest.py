@@ -11,7 +11,7 @@ from typing import Callable, Dict, List
 import numpy as np
 import pandas as pd
 
-from .metrics import rmse, mae, smape
+from .metrics import all_metrics
 
 
 def rolling_origin_backtest(
@@ -37,25 +37,25 @@ def rolling_origin_backtest(
     Returns:
         Dictionary of aggregated metrics across all folds.
     """
-    rmses: List[float] = []
-    maes: List[float] = []
-    smapes: List[float] = []
-    for start in range(0, len(df) - train_size - horizon + 1, step):
+    # Slice NumPy views per fold instead of building DataFrames each time
+    X_all = df[feature_cols].to_numpy()
+    y_all = df[target_col].to_numpy()
+    starts = range(0, len(df) - train_size - horizon + 1, step)
+    rmses = np.empty(len(starts))
+    maes = np.empty(len(starts))
+    smapes = np.empty(len(starts))
+    for fold, start in enumerate(starts):
         train_end = start + train_size
         test_end = train_end + horizon
-        train_df = df.iloc[start:train_end]
-        test_df = df.iloc[train_end:test_end]
-        X_train, y_train = train_df[feature_cols], train_df[target_col]
-        X_test, y_test = test_df[feature_cols], test_df[target_col]
         model = model_factory()
-        model.fit(X_train, y_train)
-        preds = model.predict(X_test)
-        y_true = y_test.values
-        rmses.append(rmse(y_true, preds))
-        maes.append(mae(y_true, preds))
-        smapes.append(smape(y_true, preds))
+        model.fit(X_all[start:train_end], y_all[start:train_end])
+        preds = model.predict(X_all[train_end:test_end])
+        scores = all_metrics(y_all[train_end:test_end], preds)
+        rmses[fold] = scores["rmse"]
+        maes[fold] = scores["mae"]
+        smapes[fold] = scores["smape"]
     return {
-        "rmse": float(np.mean(rmses)),
-        "mae": float(np.mean(maes)),
-        "smape": float(np.mean(smapes)),
+        "rmse": float(rmses.mean()),
+        "mae": float(maes.mean()),
+        "smape": float(smapes.mean()),
     }
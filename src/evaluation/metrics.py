@@ -2,27 +2,106 @@
 
 from __future__ import annotations
 
+from typing import Dict, Tuple
+
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy reductions
+    njit = None
+
+
+_EPS = np.finfo(float).eps
+
+
+def _error_sums_numpy(y_true: np.ndarray, y_pred: np.ndarray) -> Tuple[float, float, float]:
+    diff = y_true - y_pred
+    abs_diff = np.abs(diff)
+    denominator = np.maximum((np.abs(y_true) + np.abs(y_pred)) / 2.0, _EPS)
+    sse = float(np.einsum("i,i->", diff, diff))
+    return sse, float(abs_diff.sum()), float((abs_diff / denominator).sum())
+
+
+def _ape_sum_numpy(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    # Reuses two buffers via out= instead of allocating a temporary per operation
+    ape = np.subtract(y_true, y_pred)
+    np.abs(ape, out=ape)
+    denominator = np.abs(y_true)
+    np.maximum(denominator, _EPS, out=denominator)
+    np.divide(ape, denominator, out=ape)
+    return float(ape.sum())
+
+
+if njit is not None:
+
+    @njit
+    def _error_sums(y_true: np.ndarray, y_pred: np.ndarray) -> Tuple[float, float, float]:
+        """Squared, absolute and symmetric-percentage error sums in one pass."""
+        sse = 0.0
+        sae = 0.0
+        s_smape = 0.0
+        for i in range(y_true.shape[0]):
+            t = y_true[i]
+            p = y_pred[i]
+            d = t - p
+            ad = abs(d)
+            sse += d * d
+            sae += ad
+            s_smape += ad / max((abs(t) + abs(p)) / 2.0, _EPS)
+        return sse, sae, s_smape
+
+    @njit
+    def _ape_sum(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        """Sum of absolute percentage errors in one pass."""
+        total = 0.0
+        for i in range(y_true.shape[0]):
+            t = y_true[i]
+            total += abs(t - y_pred[i]) / max(abs(t), _EPS)
+        return total
+
+else:
+    _error_sums = _error_sums_numpy
+    _ape_sum = _ape_sum_numpy
+
+
+def _as_float_pair(y_true: np.ndarray, y_pred: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Flatten both inputs to contiguous float64 arrays of the same length."""
+    y_true = np.ascontiguousarray(y_true, dtype=np.float64).ravel()
+    y_pred = np.ascontiguousarray(y_pred, dtype=np.float64).ravel()
+    if y_true.shape != y_pred.shape:
+        raise ValueError(f"Shape mismatch: y_true {y_true.shape} vs y_pred {y_pred.shape}")
+    return y_true, y_pred
+
+
+def all_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
+    """RMSE, MAE and sMAPE computed together in a single pass over the errors."""
+    y_true, y_pred = _as_float_pair(y_true, y_pred)
+    n = y_true.shape[0]
+    if n == 0:
+        return {"rmse": float("nan"), "mae": float("nan"), "smape": float("nan")}
+    sse, sae, s_smape = _error_sums(y_true, y_pred)
+    return {"rmse": float(np.sqrt(sse / n)), "mae": sae / n, "smape": s_smape / n * 100}
+
 
 def rmse(y_true: np.ndarray, y_pred: np.ndarray) -> float:
     """Root Mean Squared Error."""
-    return float(np.sqrt(np.mean((y_true - y_pred) ** 2)))
+    return all_metrics(y_true, y_pred)["rmse"]
 
 
 def mae(y_true: np.ndarray, y_pred: np.ndarray) -> float:
     """Mean Absolute Error."""
-    return float(np.mean(np.abs(y_true - y_pred)))
+    return all_metrics(y_true, y_pred)["mae"]
 
 
 def mape(y_true: np.ndarray, y_pred: np.ndarray) -> float:
     """Mean Absolute Percentage Error (in percentage)."""
-    eps = np.finfo(float).eps
-    return float(np.mean(np.abs((y_true - y_pred) / np.maximum(np.abs(y_true), eps))) * 100)
+    y_true, y_pred = _as_float_pair(y_true, y_pred)
+    if y_true.shape[0] == 0:
+        return float("nan")
+    return _ape_sum(y_true, y_pred) / y_true.shape[0] * 100
 
 
 def smape(y_true: np.ndarray, y_pred: np.ndarray) -> float:
     """Symmetric Mean Absolute Percentage Error."""
-    eps = np.finfo(float).eps
-    denominator = (np.abs(y_true) + np.abs(y_pred)) / 2.0
-    return float(np.mean(np.abs(y_true - y_pred) / np.maximum(denominator, eps)) * 100)
+    return all_metrics(y_true, y_pred)["smape"]
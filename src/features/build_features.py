@@ -2,7 +2,7 @@
 
 This script combines the cleaned datasets and constructs a feature matrix suitable
 for model training.  It creates lagged and rolling features for key variables
-and outputs a processed CSV for downstream modelling.
+and outputs a processed Parquet file for downstream modelling.
 
 You can run this module as a script:
 
@@ -12,7 +12,7 @@ python -m src.features.build_features
 
 This will read raw data from the directory specified in `config.RAW_DATA_DIR`,
 apply transformations and save the resulting feature matrix to
-`config.PROCESSED_DATA_DIR / "features.csv"`.
+`config.FEATURES_PATH` (``data/processed/features.parquet``).
 """
 
 from __future__ import annotations
@@ -23,14 +23,40 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
-from ..config import RAW_DATA_DIR, PROCESSED_DATA_DIR
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow is optional here; fall back to pandas string methods
+    pa = pc = None
+
+from ..config import RAW_DATA_DIR, PROCESSED_DATA_DIR, FEATURES_PATH, FEATURES_FLOAT_DTYPE
 from ..data import loaders, cleaning, transforms
 from ..logging_conf import setup_logging
+from ..utils.io import write_table
 
 
 logger = logging.getLogger(__name__)
 
 
+def _sum_by_date(df: pd.DataFrame, prefix: str) -> pd.DataFrame:
+    """Sum the numeric columns per date, prefixing their names with ``prefix``.
+
+    When every date already appears once the group-by is skipped: the result
+    is the same frame with missing values counted as zero, NaT rows dropped
+    and dates sorted, which is what ``groupby("date").sum()`` would return.
+    """
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    dates = df["date"]
+    if dates.is_unique:
+        agg = df.loc[dates.notna(), ["date"] + numeric_cols]
+        if not agg["date"].is_monotonic_increasing:
+            agg = agg.sort_values("date")
+        agg = agg.set_index("date").fillna(0).add_prefix(prefix)
+    else:
+        agg = df.groupby("date")[numeric_cols].sum().add_prefix(prefix)
+    return agg.reset_index()
+
+
 def aggregate_world_energy(df: pd.DataFrame) -> pd.DataFrame:
     """Aggregate world primary energy consumption.
 
@@ -38,14 +64,7 @@ def aggregate_world_energy(df: pd.DataFrame) -> pd.DataFrame:
     columns.  We sum all numeric columns to produce a single world energy
     indicator.
     """
-    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-    agg = (
-        df.groupby("date")[numeric_cols]
-        .sum()
-        .rename(columns=lambda c: f"world_{c}")
-        .reset_index()
-    )
-    return agg
+    return _sum_by_date(df, "world_")
 
 
 def aggregate_renewables(df: pd.DataFrame) -> pd.DataFrame:
@@ -55,14 +74,25 @@ def aggregate_renewables(df: pd.DataFrame) -> pd.DataFrame:
     `renewables_capacity` and `renewables_electricity_production`.  We sum
     across the GCC countries for each date.
     """
-    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-    agg = (
-        df.groupby("date")[numeric_cols]
-        .sum()
-        .rename(columns=lambda c: f"renewables_{c}")
-        .reset_index()
-    )
-    return agg
+    return _sum_by_date(df, "renewables_")
+
+
+def _contains_total(values: pd.Series) -> np.ndarray:
+    """Boolean mask of rows whose value contains "total", ignoring case.
+
+    Uses Arrow's string kernels when the column converts cleanly to an Arrow
+    string array; mixed-type columns go through the pandas string methods.
+    Missing values never match.
+    """
+    if pc is not None and not pd.api.types.is_numeric_dtype(values):
+        try:
+            arr = pa.array(values, type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+        else:
+            matches = pc.match_substring(pc.utf8_lower(arr), "total")
+            return pc.fill_null(matches, False).to_numpy(zero_copy_only=False)
+    return values.astype(str).str.lower().str.contains("total", na=False).to_numpy()
 
 
 def prepare_saudi_production(df: pd.DataFrame) -> pd.DataFrame:
@@ -71,8 +101,6 @@ def prepare_saudi_production(df: pd.DataFrame) -> pd.DataFrame:
     Renames the production column to `saudi_production` and selects only
     relevant columns. Filters to 'Total' production values only.
     """
-    df = df.copy()
-    
     # Filter to only "Total" production indicator (not "Percentage Change")
     # Check for various possible column names
     indicator_col = None
@@ -82,8 +110,8 @@ def prepare_saudi_production(df: pd.DataFrame) -> pd.DataFrame:
             break
     
     if indicator_col and df[indicator_col].notna().any():
-        # Convert to string and filter for 'Total'
-        df = df[df[indicator_col].astype(str).str.lower().str.contains('total', na=False)]
+        # Keep rows whose indicator mentions 'Total'
+        df = df[_contains_total(df[indicator_col])]
     
     # Look for 'value' column first (the actual production values)
     if 'value' in df.columns:
@@ -107,7 +135,6 @@ def prepare_brent(df: pd.DataFrame) -> pd.DataFrame:
 
     Renames the first numeric column to `brent_price` and parses the date.
     """
-    df = df.copy()
     # Determine date column heuristically
     date_col = None
     for c in df.columns:
@@ -116,13 +143,16 @@ def prepare_brent(df: pd.DataFrame) -> pd.DataFrame:
             break
     if date_col is None:
         date_col = df.columns[0]
-    df["date"] = pd.to_datetime(df[date_col])
-    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    # A numeric "date" column is replaced by the parsed dates, so it never holds the price
+    numeric_cols = [c for c in df.select_dtypes(include=[np.number]).columns if c != "date"]
     if numeric_cols:
         price_col = numeric_cols[0]
     else:
         raise ValueError("No numeric price column found in Brent dataset")
-    df = df[["date", price_col]].rename(columns={price_col: "brent_price"})
+    # Build the two-column frame directly instead of copying the input
+    df = pd.DataFrame(
+        {"date": pd.to_datetime(df[date_col]), "brent_price": df[price_col].to_numpy()}
+    )
     df = transforms.resample_to_month_start(df, "date", ["brent_price"], how="mean")
     return df
 
@@ -165,12 +195,12 @@ def build_features() -> pd.DataFrame:
         brent_df = saudi_df[["date"]].copy()
         brent_df["brent_price"] = 0.0
 
-    # Merge all datasets on date
-    df = saudi_df.merge(brent_df, on="date", how="left")
-    df = df.merge(renew_df, on="date", how="left")
-    df = df.merge(world_df, on="date", how="left")
-    df.sort_values("date", inplace=True)
-    df.reset_index(drop=True, inplace=True)
+    # Left-join all datasets on date in one index-aligned pass
+    df = saudi_df.set_index("date").join(
+        [other.set_index("date") for other in (brent_df, renew_df, world_df)], how="left"
+    )
+    df.sort_index(inplace=True)
+    df.reset_index(inplace=True)
 
     # Forward fill missing values (simple imputation)
     df.ffill(inplace=True)
@@ -179,19 +209,26 @@ def build_features() -> pd.DataFrame:
     target_col = "saudi_production"
     exogenous = [c for c in df.columns if c not in {"date", target_col}]
 
-    # Add lags for each variable up to 6 months
-    for col in [target_col] + exogenous:
-        df = transforms.add_lag_features(df, col, lags=[1, 2, 3, 6, 12])
-        df = transforms.add_rolling_features(df, col, windows=[3, 6, 12])
+    # Add lags and rolling stats for every variable in a single pass
+    df = transforms.add_lag_rolling_features(
+        df, [target_col] + exogenous, lags=[1, 2, 3, 6, 12], windows=[3, 6, 12]
+    )
 
     # Drop rows with NaN values created by lags
     df.dropna(inplace=True)
 
+    # The features are computed in float64; storing them as float32 halves the
+    # matrix that training and the forecaster read.  Production and price
+    # levels need far fewer than float32's ~7 significant digits.
+    float_cols = df.select_dtypes(include="float64").columns
+    if FEATURES_FLOAT_DTYPE != "float64" and len(float_cols):
+        df = df.astype(dict.fromkeys(float_cols, FEATURES_FLOAT_DTYPE))
+
     # Save processed features
     PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
-    output_path = PROCESSED_DATA_DIR / "features.csv"
-    df.to_csv(output_path, index=False)
-    logger.info("Saved features to %s", output_path)
+    # Parquet keeps the dtypes and is read back far faster than CSV
+    write_table(df, FEATURES_PATH)
+    logger.info("Saved features to %s", FEATURES_PATH)
 
     return df
 
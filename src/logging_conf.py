@@ -7,14 +7,34 @@ consistent formatting and output destinations.
 
 from __future__ import annotations
 
+import atexit
+import contextlib
 import logging
 import logging.config
+import logging.handlers
+import queue
 from pathlib import Path
+from typing import Any, Iterator
+
+# Background thread that owns the console and file handlers; see setup_logging
+_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records to their handlers and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logging(log_dir: Path | None = None, log_filename: str = "project.log") -> None:
     """Configure logging for the entire project.
 
+    The root logger only gets a ``QueueHandler``; the console and rotating file
+    handlers run on a ``QueueListener`` thread, so a ``logger.info`` call never
+    waits on a disk write.  The queue is drained at interpreter exit.
+
     Args:
         log_dir: Directory where the log file will be stored.  If None,
             the current working directory is used.
@@ -54,4 +74,59 @@ def setup_logging(log_dir: Path | None = None, log_filename: str = "project.log"
         },
     }
 
+    # A previous call's listener must drain before dictConfig closes its handlers
+    _stop_listener()
     logging.config.dictConfig(logging_config)
+
+    global _listener
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    for handler in handlers:
+        root.removeHandler(handler)
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+
+class _ReplayHandler(logging.Handler):
+    """Hand records received from another process to this process's loggers."""
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        logging.getLogger(record.name).handle(record)
+        return True
+
+
+@contextlib.contextmanager
+def worker_log_queue(context: Any) -> Iterator[Any]:
+    """Yield a queue that collects the log records of worker processes.
+
+    While the block runs, records put on the queue are replayed through this
+    process's logging setup, so spawned workers need not open the log file
+    themselves (several processes rotating one file would clash).  Pass the
+    queue to `setup_worker_logging` in each worker.
+
+    Args:
+        context: The multiprocessing context the workers are started with.
+    """
+    log_queue = context.Queue()
+    listener = logging.handlers.QueueListener(log_queue, _ReplayHandler())
+    listener.start()
+    try:
+        yield log_queue
+    finally:
+        # Drains the records still queued once the workers have exited
+        listener.stop()
+
+
+def setup_worker_logging(log_queue: Any) -> None:
+    """Send every INFO and higher record of this worker process to ``log_queue``."""
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+
+atexit.register(_stop_listener)
@@ -13,18 +13,28 @@ import logging
 from typing import Dict, List, Optional
 
 import mlflow
+import numpy as np
 import pandas as pd
 
 from ..config import (
     MLFLOW_TRACKING_URI,
     MODEL_REGISTRY_STAGE,
-    PROCESSED_DATA_DIR,
+    FEATURES_PATH,
 )
 from ..data import transforms
+from ..utils.io import read_table
+from .registry import search_registered_models
 
 
 logger = logging.getLogger(__name__)
 
+_LAGS = [1, 2, 3, 6, 12]
+_WINDOWS = [3, 6, 12]
+# Lags and rolling stats are recomputed for the derived columns too (e.g. a
+# lag of ``x_roll_mean_12``), so a row depends on at most twice the longest
+# lag/window of history before it.
+_HISTORY_ROWS = 2 * max(_LAGS + _WINDOWS)
+
 
 class Forecaster:
     """A wrapper class for loading and using a model from the MLflow registry."""
@@ -33,19 +43,19 @@ class Forecaster:
         self.horizon = horizon
         self.model = None
         self.feature_columns: Optional[List[str]] = None
+        self._base_df: Optional[pd.DataFrame] = None
+        self._base_dates: Optional[np.ndarray] = None
         self._load_model()
+        self._load_base_frame()
 
     def _load_model(self) -> None:
         """Load the latest model for this horizon from MLflow."""
         mlflow.set_tracking_uri(MLFLOW_TRACKING_URI)
-        client = mlflow.tracking.MlflowClient()
         # Models are registered with names like gcc_oil_forecast_h{horizon}_<model_type>
         prefix = f"gcc_oil_forecast_h{self.horizon}_"
-        # Fetch all model versions with the given prefix and stage
-        for registered_model in client.list_registered_models():
+        # Fetch only the models with the given prefix, filtered on the server
+        for registered_model in search_registered_models(prefix):
             name = registered_model.name
-            if not name.startswith(prefix):
-                continue
             # Find version in desired stage
             for mv in registered_model.latest_versions:
                 if mv.current_stage == MODEL_REGISTRY_STAGE:
@@ -66,55 +76,145 @@ class Forecaster:
                     return
         raise RuntimeError(f"No model found for horizon {self.horizon} in stage {MODEL_REGISTRY_STAGE}")
 
-    def _prepare_inputs(
-        self, dates: List[pd.Timestamp], scenario: Dict[str, List[float]]
-    ) -> pd.DataFrame:
-        """Prepare a feature matrix for the requested prediction dates.
+    def _load_base_frame(self) -> pd.DataFrame:
+        """Return the processed feature matrix sorted by date, reading it once."""
+        if self._base_df is None:
+            base_df = read_table(FEATURES_PATH)
+            base_df.sort_values("date", inplace=True)
+            self._base_dates = base_df["date"].to_numpy()
+            self._base_df = base_df
+        return self._base_df
 
-        This implementation creates features by taking the last known processed
-        record and applying the scenario values.  It then recomputes lags and
-        rolling statistics using historical data.  For simplicity, prediction
-        intervals are not computed here.
+    def _prediction_rows(self, columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """Build one row per requested date from the last processed record.
+
+        Scenario arrays in ``columns`` override their column for the first
+        ``len(array)`` rows; the other rows keep the last observed value.
         """
-        # Load processed features for baseline
-        base_df = pd.read_csv(PROCESSED_DATA_DIR / "features.csv", parse_dates=["date"])
-        base_df.sort_values("date", inplace=True)
-        last_row = base_df.iloc[-1]
-        rows = []
-        for idx, date in enumerate(dates):
-            row = last_row.copy()
-            row["date"] = pd.to_datetime(date)
-            # Override scenario values if provided
-            for var, values in scenario.items():
-                if idx < len(values) and var in row.index:
-                    row[var] = values[idx]
-            rows.append(row)
-        df_pred = pd.DataFrame(rows)
-        # Combine with base for lag computations
-        combined = pd.concat([base_df, df_pred], ignore_index=True)
-        combined.sort_values("date", inplace=True)
-        # Recompute lags and rolling features for each variable present in training
+        base_df = self._load_base_frame()
+        dates = columns["date"]
+        n = len(dates)
+        # Build the prediction rows column by column from the last record
+        pred_cols = {}
+        for col in base_df.columns:
+            values = np.repeat(base_df[col].to_numpy()[-1:], n)
+            override = columns.get(col)
+            if col != "date" and override is not None:
+                k = min(n, len(override))
+                values = values.astype(np.result_type(values, override))
+                values[:k] = override[:k]
+            pred_cols[col] = values
+        pred_cols["date"] = dates
+        return pd.DataFrame(pred_cols)
+
+    def _add_features(self, combined: pd.DataFrame) -> pd.DataFrame:
+        """Recompute lags and rolling features for each variable present in training."""
         target_col = "saudi_production"
-        feature_cols = [c for c in base_df.columns if c not in {"date", target_col}]
-        for col in [target_col] + feature_cols:
-            combined = transforms.add_lag_features(combined, col, lags=[1, 2, 3, 6, 12])
-            combined = transforms.add_rolling_features(combined, col, windows=[3, 6, 12])
+        feature_cols = [c for c in self._base_df.columns if c not in {"date", target_col}]
+        return transforms.add_lag_rolling_features(
+            combined, [target_col] + feature_cols, lags=_LAGS, windows=_WINDOWS
+        )
+
+    def _select_features(self, pred_df: pd.DataFrame) -> pd.DataFrame:
+        """Keep only the feature columns used in training."""
+        if self.feature_columns is not None:
+            return pred_df[self.feature_columns]
+        # Fallback: drop date and target columns
+        target_col = "saudi_production"
+        drop_cols = ["date", target_col] + [c for c in pred_df.columns if c.startswith(target_col)]
+        return pred_df.drop(columns=drop_cols)
+
+    def _prepare_inputs(self, columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """Prepare a feature matrix for the requested prediction dates.
+
+        ``columns`` holds a ``"date"`` array plus optional scenario arrays keyed
+        by feature name.  Each prediction row starts from the last known
+        processed record, with scenario values applied where provided.  Lags
+        and rolling statistics are then recomputed using historical data.  For
+        simplicity, prediction intervals are not computed here.
+        """
+        # Processed features for the baseline, cached after the first call
+        base_df = self._load_base_frame()
+        dates = columns["date"]
+        n = len(dates)
+        df_pred = self._prediction_rows(columns)
+        # Only the history from _HISTORY_ROWS before the earliest requested
+        # date can influence the recomputed features of the requested rows
+        start = int(np.searchsorted(self._base_dates, dates.min(), side="left")) if n else len(base_df)
+        history = base_df.iloc[max(0, start - _HISTORY_ROWS):]
+        # Combine with history for lag computations
+        combined = pd.concat([history, df_pred], ignore_index=True)
+        # Stable sort keeps rows requested for the same date in request order
+        combined.sort_values("date", inplace=True, kind="stable")
+        combined = self._add_features(combined)
         # Drop rows that don't have full lags (the original training data)
         combined.dropna(inplace=True)
         # Extract only the prediction rows
         pred_df = combined[combined["date"].isin(dates)]
-        # Keep only feature columns used in training
-        if self.feature_columns is not None:
-            X = pred_df[self.feature_columns]
+        return self._select_features(pred_df)
+
+    def predict_fast(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """Generate forecasts from column-oriented inputs.
+
+        Args:
+            columns: ``"date"`` as a ``datetime64`` array, plus optional
+                scenario arrays keyed by feature name and aligned with it.
+
+        Returns:
+            Array of predicted production values (float32), one per date.
+        """
+        X_pred = self._prepare_inputs(columns)
+        preds = self.model.predict(X_pred)
+        return np.asarray(preds, dtype=np.float32)
+
+    def predict_what_if(self, date: str, variable: str, values: List[float]) -> np.ndarray:
+        """Predict ``date`` as is and with ``variable`` set to each of ``values``.
+
+        Rows requested for the same date in one :meth:`predict` call feed each
+        other's lags, so every row here gets its own copy of the history tail,
+        exactly as a separate call would.  The copies are stacked into one
+        frame, so the features are built once and scored in one model call.
+
+        Returns:
+            Array of predictions (float32): the baseline first, then one per
+            entry in ``values``.
+        """
+        base_df = self._load_base_frame()
+        when = np.datetime64(date, "ns")
+        n = len(values) + 1
+        # The history a separate call sees before its row: up to and including ``date``
+        start = int(np.searchsorted(self._base_dates, when, side="left"))
+        stop = int(np.searchsorted(self._base_dates, when, side="right"))
+        tail = base_df.iloc[max(0, start - _HISTORY_ROWS):stop]
+        # The scenario rows come first and the unmodified baseline row last
+        rows = self._prediction_rows(
+            {"date": np.repeat(when, n), variable: np.asarray(values, dtype=np.float64)}
+        )
+        if start >= _HISTORY_ROWS:
+            pred_df = self._stacked_features(tail, rows)
         else:
-            # Fallback: drop date and target columns
-            drop_cols = ["date", target_col] + [c for c in combined.columns if c.startswith(target_col)]
-            X = pred_df.drop(columns=drop_cols)
-        return X
+            # A short tail would let a row's lags reach into the previous copy
+            pred_df = pd.concat([self._stacked_features(tail, rows.iloc[[i]]) for i in range(n)])
+        if len(pred_df) != n:
+            raise ValueError(f"Not enough history to predict {date}")
+        preds = self.model.predict(self._select_features(pred_df))
+        return np.roll(np.asarray(preds, dtype=np.float32), 1)
+
+    def _stacked_features(self, tail: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+        """Build features for each of ``rows`` placed after its own copy of ``tail``.
+
+        Rows missing a feature are dropped, as in :meth:`_prepare_inputs`.
+        """
+        m, n = len(tail), len(rows)
+        frame = pd.concat([tail, rows], ignore_index=True)
+        # Block i of ``take`` is the tail followed by prediction row i
+        take = np.column_stack([np.tile(np.arange(m), (n, 1)), m + np.arange(n)]).ravel()
+        combined = self._add_features(frame.take(take).reset_index(drop=True))
+        return combined.iloc[(m + 1) * np.arange(1, n + 1) - 1].dropna()
 
     def predict(
         self, dates: List[str], scenario: Optional[Dict[str, List[float]]] = None
-    ) -> List[float]:
+    ) -> np.ndarray:
         """Generate forecasts for the given dates.
 
         Args:
@@ -124,11 +224,9 @@ class Forecaster:
                 name.  Each value should be a list aligned with the dates list.
 
         Returns:
-            List of predicted production values.
+            Array of predicted production values (float32), one per date.
         """
-        if scenario is None:
-            scenario = {}
-        dates_parsed = [pd.to_datetime(d) for d in dates]
-        X_pred = self._prepare_inputs(dates_parsed, scenario)
-        preds = self.model.predict(X_pred)
-        return preds.tolist()
+        columns = {"date": np.asarray(dates, dtype="datetime64[ns]")}
+        for var, values in (scenario or {}).items():
+            columns[var] = np.asarray(values, dtype=np.float64)
+        return self.predict_fast(columns)
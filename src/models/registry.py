@@ -7,10 +7,12 @@ available models and their metadata.
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Optional, List, Dict
+from typing import Iterator, Optional, List, Dict
 
 import mlflow
+from mlflow.entities.model_registry import RegisteredModel
 
 from ..config import MLFLOW_TRACKING_URI, MODEL_REGISTRY_STAGE
 
@@ -18,6 +20,33 @@ from ..config import MLFLOW_TRACKING_URI, MODEL_REGISTRY_STAGE
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def get_client() -> mlflow.tracking.MlflowClient:
+    """Return the process-wide MLflow client for the configured tracking server."""
+    mlflow.set_tracking_uri(MLFLOW_TRACKING_URI)
+    return mlflow.tracking.MlflowClient(tracking_uri=MLFLOW_TRACKING_URI)
+
+
+def search_registered_models(prefix: Optional[str] = None) -> Iterator[RegisteredModel]:
+    """Yield registered models whose names start with ``prefix``.
+
+    The prefix is sent to the server as a ``LIKE`` filter and results are
+    paged through.  ``_`` is a single-character wildcard in ``LIKE``, so names
+    are re-checked against the exact prefix.
+    """
+    client = get_client()
+    filter_string = f"name LIKE '{prefix}%'" if prefix else None
+    page_token = None
+    while True:
+        page = client.search_registered_models(filter_string=filter_string, page_token=page_token)
+        for rm in page:
+            if not prefix or rm.name.startswith(prefix):
+                yield rm
+        page_token = page.token
+        if not page_token:
+            return
+
+
 def list_models(prefix: Optional[str] = None, stage: str = MODEL_REGISTRY_STAGE) -> List[str]:
     """List registered model names filtered by prefix and stage.
 
@@ -28,16 +57,11 @@ def list_models(prefix: Optional[str] = None, stage: str = MODEL_REGISTRY_STAGE)
     Returns:
         List of model names.
     """
-    mlflow.set_tracking_uri(MLFLOW_TRACKING_URI)
-    client = mlflow.tracking.MlflowClient()
     names = []
-    for rm in client.list_registered_models():
-        name = rm.name
-        if prefix and not name.startswith(prefix):
-            continue
+    for rm in search_registered_models(prefix):
         for mv in rm.latest_versions:
             if mv.current_stage == stage:
-                names.append(name)
+                names.append(rm.name)
                 break
     return names
 
@@ -52,9 +76,7 @@ def get_model_metadata(name: str, stage: str = MODEL_REGISTRY_STAGE) -> Dict[str
     Returns:
         Dictionary containing run ID, version and tags.
     """
-    mlflow.set_tracking_uri(MLFLOW_TRACKING_URI)
-    client = mlflow.tracking.MlflowClient()
-    for mv in client.get_latest_versions(name, stages=[stage]):
+    for mv in get_client().get_latest_versions(name, stages=[stage]):
         return {
             "name": name,
             "run_id": mv.run_id,
@@ -15,16 +15,18 @@ python -m src.models.train
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Tuple
 
 import mlflow
 import mlflow.sklearn  # type: ignore
 import numpy as np
 import pandas as pd
-from sklearn.metrics import mean_squared_error, mean_absolute_error
 from sklearn.model_selection import TimeSeriesSplit
-from sklearn.linear_model import ElasticNet
+from sklearn.linear_model import ElasticNet, enet_path
 
 try:
     import lightgbm as lgb
@@ -37,13 +39,17 @@ except ImportError:
     CatBoostRegressor = None  # type: ignore
 
 from ..config import (
-    PROCESSED_DATA_DIR,
+    FEATURES_PATH,
     MLFLOW_TRACKING_URI,
     MLFLOW_EXPERIMENT_NAME,
     MODEL_REGISTRY_STAGE,
     LIGHTGBM_PARAMS,
+    TRAIN_MAX_WORKERS,
 )
-from ..logging_conf import setup_logging
+from ..evaluation.metrics import all_metrics
+from ..logging_conf import setup_logging, setup_worker_logging, worker_log_queue
+from ..utils.io import read_table
+from .registry import get_client
 
 
 logger = logging.getLogger(__name__)
@@ -51,8 +57,7 @@ logger = logging.getLogger(__name__)
 
 def load_features() -> pd.DataFrame:
     """Load the processed feature matrix from disk."""
-    features_path = PROCESSED_DATA_DIR / "features.csv"
-    df = pd.read_csv(features_path, parse_dates=["date"])
+    df = read_table(FEATURES_PATH)
     return df
 
 
@@ -71,16 +76,97 @@ def time_series_cross_val(
         Dictionary of aggregated metrics (RMSE and MAE).
     """
     tscv = TimeSeriesSplit(n_splits=n_splits)
-    rmses: List[float] = []
-    maes: List[float] = []
-    for train_idx, val_idx in tscv.split(X):
+    if isinstance(model, ElasticNet):
+        fold_preds = _elasticnet_fold_predictions(X, y, model, tscv.split(X))
+    else:
+        fold_preds = _refit_fold_predictions(X, y, model, tscv.split(X))
+    rmses = np.empty(n_splits)
+    maes = np.empty(n_splits)
+    for fold, (y_val, y_pred) in enumerate(fold_preds):
+        scores = all_metrics(y_val, y_pred)
+        rmses[fold] = scores["rmse"]
+        maes[fold] = scores["mae"]
+    return {"rmse": float(rmses.mean()), "mae": float(maes.mean())}
+
+
+def _refit_fold_predictions(X: pd.DataFrame, y: pd.Series, model, splits):
+    """Yield ``(y_val, y_pred)`` per fold, fitting ``model`` from scratch each time.
+
+    Tree models deliberately get no warm start.  Continuing from the previous
+    fold's booster would leave fold k with k times ``n_estimators`` trees, so
+    the CV scores used to pick the registered model would stop describing it.
+    Sharing one binned LightGBM Dataset across folds was measured as well: at
+    this data size, binning is a few percent of a fit, and bins computed on the
+    full matrix change the splits available on trending features.
+    """
+    for train_idx, val_idx in splits:
         X_train, y_train = X.iloc[train_idx], y.iloc[train_idx]
         X_val, y_val = X.iloc[val_idx], y.iloc[val_idx]
         model.fit(X_train, y_train)
-        y_pred = model.predict(X_val)
-        rmses.append(mean_squared_error(y_val, y_pred, squared=False))
-        maes.append(mean_absolute_error(y_val, y_pred))
-    return {"rmse": float(np.mean(rmses)), "mae": float(np.mean(maes))}
+        yield y_val, model.predict(X_val)
+
+
+def _elasticnet_fold_predictions(X: pd.DataFrame, y: pd.Series, model: ElasticNet, splits):
+    """Yield ``(y_val, y_pred)`` per fold for an ElasticNet using a running Gram matrix.
+
+    TimeSeriesSplit produces nested, expanding training windows, so ``X.T @ X``
+    and ``X.T @ y`` are updated with only the rows each fold adds and handed to
+    the precomputed-Gram coordinate descent in ``enet_path``.  Each fold is
+    warm-started from the previous fold's coefficients.  With an intercept the
+    sums are accumulated on data shifted by the first fold's column means,
+    which keeps the centring numerically stable.
+    """
+    X_all = X.to_numpy(dtype=np.float64)
+    y_all = y.to_numpy(dtype=np.float64)
+    n_features = X_all.shape[1]
+    shift_x, shift_y = np.zeros(n_features), 0.0
+    coef = None
+    seen = 0
+    for train_idx, val_idx in splits:
+        end = len(train_idx)
+        if train_idx[0] != 0 or train_idx[-1] != end - 1 or end < seen:
+            seen = 0  # not an expanding window; start the sums over
+        if seen == 0:
+            if model.fit_intercept:
+                shift_x, shift_y = X_all[:end].mean(axis=0), y_all[:end].mean()
+            gram = np.zeros((n_features, n_features))
+            xty = np.zeros(n_features)
+            sum_x = np.zeros(n_features)
+            sum_y = 0.0
+        dX = X_all[seen:end] - shift_x
+        dy = y_all[seen:end] - shift_y
+        gram += np.dot(dX.T, dX)
+        xty += np.dot(dX.T, dy)
+        sum_x += dX.sum(axis=0)
+        sum_y += dy.sum()
+        seen = end
+
+        if model.fit_intercept:
+            mean_x, mean_y = sum_x / end, sum_y / end
+            G = gram - end * np.outer(mean_x, mean_x)
+            Xy = xty - end * mean_x * mean_y
+            offset_x, offset_y = shift_x + mean_x, shift_y + mean_y
+        else:
+            G, Xy = gram, xty
+            offset_x, offset_y = shift_x, shift_y
+        _, coefs, _ = enet_path(
+            np.asfortranarray(X_all[:end] - offset_x),
+            y_all[:end] - offset_y,
+            l1_ratio=model.l1_ratio,
+            alphas=[model.alpha],
+            precompute=G,
+            Xy=Xy,
+            coef_init=coef,
+            positive=model.positive,
+            check_input=False,
+            max_iter=model.max_iter,
+            tol=model.tol,
+            random_state=model.random_state,
+            selection=model.selection,
+        )
+        coef = coefs[:, 0]
+        intercept = offset_y - np.dot(offset_x, coef)
+        yield y.iloc[val_idx], np.dot(X_all[val_idx], coef) + intercept
 
 
 def train_and_log_model(
@@ -124,7 +210,8 @@ def train_and_log_model(
         cv_metrics = time_series_cross_val(X, y, model)
         mlflow.log_metric("rmse", cv_metrics["rmse"])
         mlflow.log_metric("mae", cv_metrics["mae"])
-        # Fit on full data
+        # Fit on full data.  This is a full refit on purpose: boosting on only
+        # the rows the last fold held out would register a different model
         model.fit(X, y)
         # Log model
         mlflow.sklearn.log_model(
@@ -136,8 +223,38 @@ def train_and_log_model(
     return {"metrics": cv_metrics, "run_id": run_id}
 
 
+def _init_training_worker(log_queue: Any) -> None:
+    """Point a freshly spawned training process at the tracking server and experiment.
+
+    Its log records go to ``log_queue`` and are written by the parent process.
+    """
+    setup_worker_logging(log_queue)
+    mlflow.set_tracking_uri(MLFLOW_TRACKING_URI)
+    mlflow.set_experiment(MLFLOW_EXPERIMENT_NAME)
+
+
+def _train_one(
+    X: pd.DataFrame, y: pd.Series, horizon: int, model_type: str, params: Dict[str, object]
+) -> Tuple[int, str, Dict[str, object]]:
+    """Train and log one (horizon, model type) pair; runs inside a worker process."""
+    res = train_and_log_model(
+        X=X,
+        y=y,
+        horizon=horizon,
+        model_name="gcc_oil_forecast",
+        params=params,
+        model_type=model_type,
+    )
+    return horizon, model_type, res
+
+
 def train_all_horizons() -> None:
     """Train models for forecast horizons 1 to 6 and register the best ones.
+
+    The 18 (horizon, model type) runs are independent, so they are trained in
+    up to ``TRAIN_MAX_WORKERS`` processes, with the tree models' own threads
+    capped so the processes together do not oversubscribe the cores.  Best
+    model selection and registry transitions then happen in this process.
     """
     setup_logging(Path("logs"))
     logger.info("Starting training for all horizons")
@@ -149,36 +266,54 @@ def train_all_horizons() -> None:
     feature_cols = [c for c in df.columns if c not in {"date", target} and not c.startswith(target)]
 
     results = []
+    workers = max(1, TRAIN_MAX_WORKERS)
+    threads = max(1, (os.cpu_count() or 1) // workers)
     # Define simple hyperparameters for demonstration
-    lightgbm_params = LIGHTGBM_PARAMS
-    catboost_params = {"depth": 6, "learning_rate": 0.05, "iterations": 500}
+    lightgbm_params = {**LIGHTGBM_PARAMS, "n_jobs": threads}
+    catboost_params = {"depth": 6, "learning_rate": 0.05, "iterations": 500, "thread_count": threads}
     elasticnet_params = {"alpha": 0.1, "l1_ratio": 0.5}
-
-    for horizon in [1, 2, 3, 4, 5, 6]:
-        logger.info("Training models for horizon %d", horizon)
-        # Shift target forward by horizon months
-        df_h = df.copy()
-        df_h[f"target_h{horizon}"] = df_h[target].shift(-horizon)
-        df_h = df_h.dropna(subset=[f"target_h{horizon}"])
-        X = df_h[feature_cols]
-        y = df_h[f"target_h{horizon}"]
-
-        # Train each model type and collect metrics
-        metrics_dict = {}
+    horizons = [1, 2, 3, 4, 5, 6]
+
+    # Only the target moves between horizons, so the features are projected once.
+    # X stays a DataFrame so the fitted models keep the feature names the
+    # forecaster reads back from them.
+    X_full = df[feature_cols]
+    jobs = []
+    for horizon in horizons:
+        # Shift target forward by horizon months and drop the rows it leaves empty
+        y_h = df[target].shift(-horizon).rename(f"target_h{horizon}")
+        keep = y_h.notna().to_numpy()
+        X = X_full[keep]
+        y = y_h[keep]
         for model_type, params in [
             ("lightgbm", lightgbm_params),
             ("catboost", catboost_params),
             ("elasticnet", elasticnet_params),
         ]:
-            res = train_and_log_model(
-                X=X,
-                y=y,
-                horizon=horizon,
-                model_name="gcc_oil_forecast",
-                params=params,
-                model_type=model_type,
-            )
-            metrics_dict[model_type] = res
+            jobs.append((X, y, horizon, model_type, params))
+
+    logger.info("Training %d models with %d worker process(es)", len(jobs), workers)
+    if workers == 1:
+        outputs = [_train_one(*job) for job in jobs]
+    else:
+        # Spawned rather than forked workers: the parent already holds MLflow
+        # HTTP connections that must not be shared across processes
+        context = multiprocessing.get_context("spawn")
+        with worker_log_queue(context) as log_queue, ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_training_worker,
+            initargs=(log_queue,),
+        ) as pool:
+            futures = [pool.submit(_train_one, *job) for job in jobs]
+            outputs = [future.result() for future in futures]
+
+    metrics_by_horizon: Dict[int, Dict[str, Dict[str, object]]] = {h: {} for h in horizons}
+    for horizon, model_type, res in outputs:
+        metrics_by_horizon[horizon][model_type] = res
+
+    for horizon in horizons:
+        metrics_dict = metrics_by_horizon[horizon]
         # Determine best model by lowest RMSE
         best_model_type = min(metrics_dict, key=lambda m: metrics_dict[m]["metrics"]["rmse"])
         best_run_id = metrics_dict[best_model_type]["run_id"]
@@ -193,8 +328,7 @@ def train_all_horizons() -> None:
         registered_name = f"gcc_oil_forecast_h{horizon}_{best_model_type}"
         # register model version and transition to stage
         mv = mlflow.register_model(model_uri, registered_name)
-        client = mlflow.tracking.MlflowClient()
-        client.transition_model_version_stage(
+        get_client().transition_model_version_stage(
             name=registered_name,
             version=mv.version,
             stage=MODEL_REGISTRY_STAGE,
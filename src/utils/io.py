@@ -2,9 +2,28 @@
 
 from __future__ import annotations
 
+import csv
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Iterable, Iterator, Tuple
+
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow
+    import pyarrow.csv
+    import pyarrow.types
+except ImportError:
+    pyarrow = None  # type: ignore
+
+
+# read_csv options the pyarrow engine cannot honour; their presence keeps the C engine
+_C_ONLY_CSV_OPTIONS = frozenset(
+    {"chunksize", "iterator", "converters", "skipfooter", "nrows", "low_memory", "memory_map"}
+)
+
 
 def ensure_dir(path: Path) -> None:
     """Create a directory if it does not exist."""
@@ -12,11 +31,149 @@ def ensure_dir(path: Path) -> None:
 
 
 def read_csv(path: Path, **kwargs) -> pd.DataFrame:
-    """Wrapper around pandas.read_csv with path support."""
+    """Wrapper around pandas.read_csv with path support.
+
+    Unless the caller picks an engine or passes options only the C engine
+    supports, the file is parsed with the multithreaded pyarrow engine.  If
+    pyarrow rejects the options the C engine reads it instead, memory-mapped.
+
+    Unlike the C engine, pyarrow infers types from ISO-8601 text: timestamp
+    columns come back as ``datetime64`` and plain date columns as
+    ``datetime.date`` objects rather than as strings, as in the data loaders.
+    The original text cannot be recovered from that result, so callers that
+    need such columns as strings should pass ``engine="c"``.
+    """
+    if "engine" not in kwargs and pyarrow is not None and not _C_ONLY_CSV_OPTIONS & kwargs.keys():
+        try:
+            return pd.read_csv(path, engine="pyarrow", **kwargs)
+        except ValueError:
+            pass
+        kwargs.setdefault("memory_map", True)
     return pd.read_csv(path, **kwargs)
 
 
-def write_csv(df: pd.DataFrame, path: Path, **kwargs) -> None:
-    """Write a DataFrame to CSV and ensure directory exists."""
+def stream_csv(path: Path, **fmtparams) -> Iterator[Dict[str, str]]:
+    """Yield the rows of a CSV file as dictionaries keyed by the header.
+
+    For row-by-row processing this avoids building a DataFrame at all.
+    ``fmtparams`` go to `csv.DictReader` (e.g. ``delimiter=";"``); values are
+    left as strings.
+    """
+    with Path(path).open(newline="", encoding="utf-8-sig") as f:
+        yield from csv.DictReader(f, **fmtparams)
+
+
+# Characters that make a CSV field need quoting
+_CSV_SPECIAL_CHARS = frozenset(',"\r\n')
+
+
+def _arrow_csv_matches(df: pd.DataFrame, table: "pyarrow.Table") -> bool:
+    """Whether pyarrow's CSV writer can write ``df`` the way ``to_csv`` reads back.
+
+    Booleans and temporal values are spelled differently (``true``/``false``,
+    timestamps with nanoseconds that ``pd.read_csv`` leaves as strings), and
+    floats are written without a trailing ``.0``, so a float column of whole
+    numbers would read back as integers.  Headers needing quotes are ruled
+    out too since the header line is written separately.
+    """
+    if any(
+        pyarrow.types.is_boolean(field.type) or pyarrow.types.is_temporal(field.type)
+        for field in table.schema
+    ):
+        return False
+    if any(_CSV_SPECIAL_CHARS.intersection(str(name)) for name in df.columns):
+        return False
+    for _, column in df.items():
+        if pd.api.types.is_float_dtype(column.dtype):
+            values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+            values = values[np.isfinite(values)]
+            if values.size and (values == np.round(values)).all():
+                return False
+    return True
+
+
+def write_csv(df: pd.DataFrame, path: Path, preserve_index: bool = False, **kwargs) -> None:
+    """Write a DataFrame to CSV and ensure directory exists.
+
+    The index is dropped unless ``preserve_index`` is set.  Without pandas
+    formatting options the frame is written by pyarrow's columnar CSV writer,
+    which is much faster than ``to_csv``, unquoted like ``to_csv`` output.
+    Frames it would spell differently (see `_arrow_csv_matches`), and frames
+    Arrow cannot convert or write (e.g. list values, strings needing quotes),
+    go through ``to_csv``.  There MultiIndex and named indexes are reset first
+    because ``to_csv(index=False)`` is very slow on them (pandas issue
+    #59312).
+    """
     ensure_dir(path.parent)
+    if preserve_index:
+        df.to_csv(path, index=True, **kwargs)
+        return
+    if pyarrow is not None and not kwargs:
+        try:
+            table = pyarrow.Table.from_pandas(df, preserve_index=False)
+            if _arrow_csv_matches(df, table):
+                options = pyarrow.csv.WriteOptions(include_header=False, quoting_style="none")
+                with open(path, "wb") as f:
+                    f.write((",".join(map(str, df.columns)) + "\n").encode("utf-8"))
+                    pyarrow.csv.write_csv(table, f, write_options=options)
+                return
+        except pyarrow.ArrowException:
+            # A partially written file is overwritten below
+            pass
+    if isinstance(df.index, pd.MultiIndex) or df.index.name is not None:
+        df = df.reset_index(drop=True)
+    # to_csv already formats rows in chunks and writes them through a buffered
+    # handle; a 1 MiB user buffer measured no faster, so pandas opens the file
     df.to_csv(path, index=False, **kwargs)
+
+
+def write_table(df: pd.DataFrame, path: Path, **kwargs) -> None:
+    """Write a DataFrame in the format given by the file extension.
+
+    ``.parquet`` is written with zstd compression and ``.feather`` with lz4;
+    both are much smaller and faster to read back than CSV, which remains
+    available through ``.csv``.  The index is not stored, as with `write_csv`.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    ensure_dir(path.parent)
+    if suffix == ".parquet":
+        kwargs.setdefault("compression", "zstd")
+        df.to_parquet(path, engine="pyarrow", index=False, **kwargs)
+    elif suffix == ".feather":
+        kwargs.setdefault("compression", "lz4")
+        df.reset_index(drop=True).to_feather(path, **kwargs)
+    elif suffix == ".csv":
+        write_csv(df, path, **kwargs)
+    else:
+        raise ValueError(f"Unsupported table format: {path.suffix}")
+
+
+def read_table(path: Path, **kwargs) -> pd.DataFrame:
+    """Read a DataFrame written by `write_table`, dispatching on the file extension."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        return pd.read_parquet(path, engine="pyarrow", **kwargs)
+    if suffix == ".feather":
+        return pd.read_feather(path, **kwargs)
+    if suffix == ".csv":
+        return read_csv(path, **kwargs)
+    raise ValueError(f"Unsupported table format: {path.suffix}")
+
+
+def write_many(items: Iterable[Tuple[pd.DataFrame, Path]], max_workers: int | None = None) -> None:
+    """Write several DataFrames concurrently with `write_table`.
+
+    The Parquet, Feather and Arrow CSV writers release the GIL while encoding
+    and writing, so a thread pool overlaps the writes.  ``max_workers``
+    defaults to the CPU count, capped at 8; on a single core the writes run
+    one after another.  Every write is attempted; the first failure is
+    re-raised once all have finished.
+    """
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(write_table, df, Path(path)) for df, path in items]
+    for future in futures:
+        future.result()
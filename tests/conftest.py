@@ -0,0 +1,85 @@
+"""Shared pytest fixtures and import paths.
+
+pytest loads this module before collecting the test files, so the repository
+root (for the ``src`` package), ``src`` and ``api`` are put on ``sys.path``
+once here for every test module.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+root_dir = Path(__file__).resolve().parents[1]
+for path in (root_dir, root_dir / "src", root_dir / "api"):
+    if str(path) not in sys.path:
+        sys.path.append(str(path))
+
+# Point MLflow at a throwaway local store unless one is configured, so the API
+# tests do not wait on retries against the docker-compose tracking server
+os.environ.setdefault(
+    "MLFLOW_TRACKING_URI",
+    "sqlite:///" + str(Path(tempfile.mkdtemp(prefix="mlflow-tests-")) / "mlflow.db"),
+)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "slow: reads the full raw datasets or runs the feature pipeline"
+    )
+
+
+# Seconds a worker waits for another worker's feature build before giving up
+_FEATURES_BUILD_TIMEOUT = 600
+
+
+@pytest.fixture(scope="session")
+def features_df(tmp_path_factory: pytest.TempPathFactory) -> pd.DataFrame:
+    """Feature matrix built once per test run and shared by the tests.
+
+    Building it reads every raw dataset, so one session builds it and writes
+    a Feather snapshot.  Under pytest-xdist the snapshot sits in the run's
+    shared temporary directory, guarded by a lock file, and the other workers
+    wait for it (failing after ``_FEATURES_BUILD_TIMEOUT`` seconds) and read it
+    back instead of rebuilding.  Tests must treat the frame as read-only.
+    """
+    from src.config import RAW_DATA_DIR
+    from src.features import build_features
+
+    # The large raw downloads are not committed (e.g. in CI)
+    if not (Path(RAW_DATA_DIR) / "world_primary_csv.zip").exists():
+        pytest.skip("Raw datasets needed to build the feature matrix are not available")
+
+    base = tmp_path_factory.getbasetemp()
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        base = base.parent
+    snapshot = base / "features.feather"
+    lock = base / "features.lock"
+    deadline = time.monotonic() + _FEATURES_BUILD_TIMEOUT
+    while not snapshot.exists():
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            # Another worker is building; if it fails it removes the lock
+            if time.monotonic() > deadline:
+                pytest.fail(
+                    f"Timed out after {_FEATURES_BUILD_TIMEOUT}s waiting for {snapshot}; "
+                    f"remove {lock} if a previous run was killed mid-build"
+                )
+            time.sleep(0.1)
+            continue
+        try:
+            df = build_features.build_features().reset_index(drop=True)
+            partial = snapshot.with_name(f"features.{os.getpid()}.feather")
+            df.to_feather(partial)
+            os.replace(partial, snapshot)
+            return df
+        finally:
+            os.close(fd)
+            if not snapshot.exists():
+                lock.unlink()
+    return pd.read_feather(snapshot)
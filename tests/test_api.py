@@ -1,29 +1,28 @@
 """Tests for the FastAPI application."""
 
-import sys
-from pathlib import Path
+from typing import Iterator
 
+import pytest
 from fastapi.testclient import TestClient
+from main import app, get_forecaster  # type: ignore
 
-root_dir = Path(__file__).resolve().parents[1]
-src_path = root_dir / "api"
-if str(src_path) not in sys.path:
-    sys.path.append(str(src_path))
 
-from main import app  # type: ignore
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    """One client for the module; the context manager runs the app lifespan once."""
+    with TestClient(app) as c:
+        yield c
 
 
-def test_health_endpoint() -> None:
+def test_health_endpoint(client: TestClient) -> None:
     """Test the health check endpoint returns OK status."""
-    client = TestClient(app)
     resp = client.get("/health")
     assert resp.status_code == 200
     assert resp.json() == {"status": "ok"}
 
 
-def test_predict_endpoint_structure() -> None:
+def test_predict_endpoint_structure(client: TestClient) -> None:
     """Test that predict endpoint accepts valid request structure."""
-    client = TestClient(app)
     payload = {
         "dates": ["2025-01-01", "2025-02-01"]
     }
@@ -32,26 +31,41 @@ def test_predict_endpoint_structure() -> None:
     assert resp.status_code in [200, 500]  # Either works or model not found
     
 
-def test_predict_endpoint_validation() -> None:
+def test_predict_endpoint_validation(client: TestClient) -> None:
     """Test that predict endpoint validates input properly."""
-    client = TestClient(app)
-    # Test with empty dates list
-    payload = {"dates": []}
-    resp = client.post("/predict", json=payload)
-    assert resp.status_code == 400  # Should reject empty dates
+    # Stand in for the model so a missing registry entry cannot mask validation
+    app.dependency_overrides[get_forecaster] = lambda: object()
+    try:
+        # Test with empty dates list
+        payload = {"dates": []}
+        resp = client.post("/predict", json=payload)
+    finally:
+        app.dependency_overrides.pop(get_forecaster, None)
+    assert resp.status_code == 422  # PredictRequest.dates requires at least one date
     
 
-def test_predict_endpoint_invalid_date() -> None:
+@pytest.mark.parametrize("key", ["date", "saudi_production", "brent_price_lag_1", "brent_price_roll_mean_3"])
+def test_predict_rejects_reserved_scenario_keys(client: TestClient, key: str) -> None:
+    """Scenario keys that are not feature inputs cannot override the request."""
+    app.dependency_overrides[get_forecaster] = lambda: object()
+    try:
+        payload = {"dates": ["2025-01-01"], "scenario": {key: [1.0]}}
+        resp = client.post("/predict", json=payload)
+    finally:
+        app.dependency_overrides.pop(get_forecaster, None)
+    assert resp.status_code == 422
+    assert key in resp.text
+
+
+def test_predict_endpoint_invalid_date(client: TestClient) -> None:
     """Test that predict endpoint handles invalid date format."""
-    client = TestClient(app)
     payload = {"dates": ["not-a-date"]}
     resp = client.post("/predict", json=payload)
     # Should return error for invalid date format
     assert resp.status_code in [400, 422, 500]
 
 
-def test_api_cors_headers() -> None:
+def test_api_cors_headers(client: TestClient) -> None:
     """Test that CORS middleware is properly configured."""
-    client = TestClient(app)
     resp = client.get("/health")
     assert "access-control-allow-origin" in resp.headers or resp.status_code == 200
@@ -1,56 +1,70 @@
 """Tests for feature engineering."""
 
-import sys
-from pathlib import Path
-
 import pandas as pd
+import pytest
 
-root_dir = Path(__file__).resolve().parents[1]
-src_path = root_dir / "src"
-if str(src_path) not in sys.path:
-    sys.path.append(str(src_path))
-
-from features import build_features  # type: ignore
+from src.features import build_features
 
 
-def test_build_features() -> None:
-    df = build_features.build_features()
+@pytest.mark.slow
+def test_build_features(features_df: pd.DataFrame) -> None:
+    df = features_df
     assert isinstance(df, pd.DataFrame)
     assert "saudi_production" in df.columns
     # Check lagged and rolling features exist
     assert any(col.endswith("_lag_1") for col in df.columns)
 
 
-def test_features_no_null_target() -> None:
+@pytest.mark.slow
+def test_features_no_null_target(features_df: pd.DataFrame) -> None:
     """Test that target variable has no null values."""
-    df = build_features.build_features()
+    df = features_df
     assert df["saudi_production"].notna().all()
 
 
-def test_features_have_date_index() -> None:
+@pytest.mark.slow
+def test_features_have_date_index(features_df: pd.DataFrame) -> None:
     """Test that features dataframe has datetime index."""
-    df = build_features.build_features()
+    df = features_df
     assert isinstance(df.index, pd.DatetimeIndex) or "date" in df.columns
 
 
-def test_rolling_features_created() -> None:
+@pytest.mark.slow
+def test_rolling_features_created(features_df: pd.DataFrame) -> None:
     """Test that rolling window features are created."""
-    df = build_features.build_features()
+    df = features_df
     rolling_cols = [col for col in df.columns if "rolling" in col.lower()]
     assert len(rolling_cols) > 0
 
 
-def test_lagged_features_created() -> None:
+@pytest.mark.slow
+def test_lagged_features_created(features_df: pd.DataFrame) -> None:
     """Test that lagged features are created."""
-    df = build_features.build_features()
+    df = features_df
     lag_cols = [col for col in df.columns if "lag" in col.lower()]
     assert len(lag_cols) > 0
 
 
-def test_features_shape() -> None:
+@pytest.mark.slow
+def test_features_shape(features_df: pd.DataFrame) -> None:
     """Test that features dataframe has reasonable shape."""
-    df = build_features.build_features()
+    df = features_df
     # Should have more than 10 rows (enough historical data)
     assert len(df) > 10
     # Should have multiple features (at least target + some engineered features)
     assert len(df.columns) >= 10
+
+
+def test_aggregates_prefix_and_sum_per_date() -> None:
+    """Test that both aggregation paths sum per date and prefix the columns."""
+    dates = pd.to_datetime(["2020-02-01", "2020-01-01"])
+    unique = pd.DataFrame({"date": dates, "value": [2.0, None], "country": ["SA", "AE"]})
+    world = build_features.aggregate_world_energy(unique)
+    assert list(world.columns) == ["date", "world_value"]
+    assert world["date"].is_monotonic_increasing
+    assert world["world_value"].tolist() == [0.0, 2.0]
+
+    repeated = pd.DataFrame({"date": dates.repeat(2), "value": [1.0, 2.0, 3.0, 4.0]})
+    renew = build_features.aggregate_renewables(repeated)
+    assert list(renew.columns) == ["date", "renewables_value"]
+    assert renew["renewables_value"].tolist() == [7.0, 3.0]
@@ -0,0 +1,76 @@
+"""Tests for the inference helpers in ``src.models.forecast``."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models import forecast
+from src.models.forecast import Forecaster
+
+
+class _SumModel:
+    """Stand-in model whose prediction depends on every feature of a row."""
+
+    def predict(self, X: pd.DataFrame) -> np.ndarray:
+        return X.astype(float).sum(axis=1).to_numpy()
+
+
+@pytest.fixture
+def forecaster() -> Forecaster:
+    """Forecaster over a small synthetic feature matrix, bypassing MLflow."""
+    rng = np.random.default_rng(0)
+    n = 48
+    base_df = pd.DataFrame(
+        {
+            "date": pd.date_range("2015-01-01", periods=n, freq="MS"),
+            "saudi_production": rng.normal(10.0, 1.0, n),
+            "brent_price": rng.normal(70.0, 5.0, n),
+        }
+    )
+    f = object.__new__(Forecaster)
+    f.horizon = 1
+    f.model = _SumModel()
+    f.feature_columns = None
+    f._base_df = base_df
+    f._base_dates = base_df["date"].to_numpy()
+    return f
+
+
+def test_predict_what_if_matches_separate_calls(forecaster: Forecaster) -> None:
+    date = "2019-01-01"
+    values = [50.0, 70.0, 90.0]
+    preds = forecaster.predict_what_if(date, "brent_price", values)
+    expected = [forecaster.predict([date])[0]] + [
+        forecaster.predict([date], {"brent_price": [v]})[0] for v in values
+    ]
+    np.testing.assert_allclose(preds, expected, rtol=1e-6)
+    # The scenario values must actually move the prediction
+    assert len(set(preds[1:].tolist())) == len(values)
+
+
+# 2016-06-01 has less than _HISTORY_ROWS of history, so each row is built on its own
+@pytest.mark.parametrize("date", ["2017-06-01", "2016-06-01"])
+def test_predict_what_if_within_history(forecaster: Forecaster, date: str) -> None:
+    """A date already in the data is scored on the history up to and including it."""
+    values = [40.0, 80.0]
+    preds = forecaster.predict_what_if(date, "brent_price", values)
+    # A separate call also returns the recorded row for that date; the requested row is last
+    expected = [forecaster.predict([date])[-1]] + [
+        forecaster.predict([date], {"brent_price": [v]})[-1] for v in values
+    ]
+    np.testing.assert_allclose(preds, expected, rtol=1e-6)
+
+
+def test_predict_what_if_builds_features_once(
+    forecaster: Forecaster, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = []
+    build = forecast.transforms.add_lag_rolling_features
+
+    def counting_build(df: pd.DataFrame, *args, **kwargs) -> pd.DataFrame:
+        calls.append(len(df))
+        return build(df, *args, **kwargs)
+
+    monkeypatch.setattr(forecast.transforms, "add_lag_rolling_features", counting_build)
+    forecaster.predict_what_if("2019-01-01", "brent_price", [50.0, 70.0, 90.0])
+    assert len(calls) == 1
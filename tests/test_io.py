@@ -0,0 +1,141 @@
+"""Tests for the file IO helpers."""
+
+import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.io import read_csv, read_table, stream_csv, write_csv, write_many, write_table
+
+
+def _sample_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": pd.date_range("2020-01-01", periods=5, freq="MS"),
+            "value": np.linspace(1.0, 2.0, 5),
+            "name": list("abcde"),
+        },
+        index=pd.RangeIndex(10, 15, name="row"),
+    )
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".feather"])
+def test_table_roundtrip(tmp_path: Path, suffix: str) -> None:
+    """Binary formats round-trip dtypes exactly and drop the index."""
+    pytest.importorskip("pyarrow")
+    df = _sample_frame()
+    path = tmp_path / "nested" / f"table{suffix}"
+    write_table(df, path)
+    assert path.exists()
+    pd.testing.assert_frame_equal(read_table(path), df.reset_index(drop=True))
+
+
+def test_table_dispatch_is_case_insensitive(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    df = _sample_frame()
+    path = tmp_path / "table.PARQUET"
+    write_table(df, path)
+    # Written as Parquet, not any of the other formats
+    pd.testing.assert_frame_equal(pd.read_parquet(path), df.reset_index(drop=True))
+    pd.testing.assert_frame_equal(read_table(path), df.reset_index(drop=True))
+
+
+def test_table_csv_dispatch(tmp_path: Path) -> None:
+    df = _sample_frame()[["value", "name"]]
+    path = tmp_path / "table.csv"
+    write_table(df, path)
+    pd.testing.assert_frame_equal(read_table(path), df.reset_index(drop=True))
+
+
+def test_write_csv_matches_to_csv_for_dates_and_booleans(tmp_path: Path) -> None:
+    """Temporal and boolean columns are spelled exactly as ``to_csv`` would."""
+    df = _sample_frame().assign(flag=[True, False, True, True, False])
+    path = tmp_path / "mixed.csv"
+    write_csv(df, path)
+    assert path.read_text() == df.to_csv(index=False)
+    back = pd.read_csv(path, parse_dates=["date"])
+    pd.testing.assert_frame_equal(back, df.reset_index(drop=True))
+
+
+def test_write_csv_numeric_roundtrip(tmp_path: Path) -> None:
+    """Output reads back with the same dtypes through plain ``pd.read_csv`` and `read_csv`."""
+    df = pd.DataFrame(
+        {
+            "year": np.arange(2000, 2005),
+            "value": np.linspace(0.1, 0.5, 5),
+            "whole": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "name": list("abcde"),
+        }
+    )
+    path = tmp_path / "numeric.csv"
+    write_csv(df, path)
+    pd.testing.assert_frame_equal(pd.read_csv(path), df)
+    pd.testing.assert_frame_equal(read_csv(path), df)
+
+
+def test_write_csv_fast_path_is_unquoted(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"year": [2000, 2001], "value": [0.5, 1.25], "name": pd.Categorical(["a", "b"])})
+    path = tmp_path / "plain.csv"
+    write_csv(df, path)
+    assert path.read_text() == "year,value,name\n2000,0.5,a\n2001,1.25,b\n"
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"name": ["a,b", 'say "hi"'], "value": [0.5, 1.5]}),
+        pd.DataFrame({"values": [[1, 2], [3]], "value": [0.5, 1.5]}),
+        pd.DataFrame({"a,b": [0.5, 1.5]}),
+    ],
+)
+def test_write_csv_falls_back_to_to_csv(tmp_path: Path, df: pd.DataFrame) -> None:
+    """Values pyarrow cannot write unquoted, or at all, are left to ``to_csv``."""
+    path = tmp_path / "fallback.csv"
+    write_csv(df, path)
+    assert path.read_text() == df.to_csv(index=False)
+
+
+def test_read_csv_date_inference(tmp_path: Path) -> None:
+    """ISO text is parsed by the default pyarrow engine and kept as strings by the C engine."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "dates.csv"
+    path.write_text("day,stamp,value\n2020-01-01,2020-01-01T10:00,1.5\n2020-02-01,2020-02-01T11:30,2.5\n")
+    parsed = read_csv(path)
+    assert parsed["stamp"].dtype.kind == "M"
+    assert parsed["day"].tolist() == [datetime.date(2020, 1, 1), datetime.date(2020, 2, 1)]
+    text = read_csv(path, engine="c")
+    assert text["day"].tolist() == ["2020-01-01", "2020-02-01"]
+    assert text["stamp"].tolist() == ["2020-01-01T10:00", "2020-02-01T11:30"]
+
+
+@pytest.mark.parametrize("name", ["table.xlsx", "table"])
+def test_table_unknown_extension(tmp_path: Path, name: str) -> None:
+    path = tmp_path / name
+    with pytest.raises(ValueError, match="Unsupported table format"):
+        write_table(_sample_frame(), path)
+    assert not path.exists()
+    with pytest.raises(ValueError, match="Unsupported table format"):
+        read_table(path)
+
+
+def test_stream_csv_strips_bom(tmp_path: Path) -> None:
+    """A UTF-8 byte-order mark does not leak into the first header name."""
+    path = tmp_path / "bom.csv"
+    path.write_bytes("\ufeffYear;Value\n2015;10.2\n2016;10.4\n".encode("utf-8"))
+    rows = list(stream_csv(path, delimiter=";"))
+    assert rows == [{"Year": "2015", "Value": "10.2"}, {"Year": "2016", "Value": "10.4"}]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_write_many_attempts_all_then_raises_first_error(tmp_path: Path, max_workers: int) -> None:
+    pytest.importorskip("pyarrow")
+    df = _sample_frame()
+    good = [tmp_path / "a.parquet", tmp_path / "b.feather", tmp_path / "c.csv"]
+    items = [(df, tmp_path / "bad.xlsx"), (df, good[0]), (df, tmp_path / "bad.txt"), (df, good[1]), (df, good[2])]
+    with pytest.raises(ValueError, match=r"\.xlsx"):
+        write_many(items, max_workers=max_workers)
+    # The failures did not stop the writes queued after them
+    assert all(path.exists() for path in good)
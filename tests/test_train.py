@@ -1,22 +1,25 @@
 """Tests for model training utilities."""
 
-import sys
-from pathlib import Path
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
-root_dir = Path(__file__).resolve().parents[1]
-src_path = root_dir / "src"
-if str(src_path) not in sys.path:
-    sys.path.append(str(src_path))
-
-from models import train  # type: ignore
+import numpy as np
 import pandas as pd
+import pytest
+from sklearn.linear_model import ElasticNet, LinearRegression
+from sklearn.model_selection import TimeSeriesSplit
+from sklearn.tree import DecisionTreeRegressor
+
+from src.logging_conf import worker_log_queue
+from src.models import train
 
 
 def test_time_series_cross_val() -> None:
     # Create dummy dataset
     X = pd.DataFrame({"x": range(10)})
     y = pd.Series(range(10))
-    model = __import__("sklearn.linear_model").linear_model.LinearRegression()
+    model = LinearRegression()
     metrics = train.time_series_cross_val(X, y, model, n_splits=2)
     assert "rmse" in metrics
     assert "mae" in metrics
@@ -26,7 +29,7 @@ def test_time_series_cross_val_returns_numeric() -> None:
     """Test that cross-validation returns numeric metrics."""
     X = pd.DataFrame({"x": range(20)})
     y = pd.Series(range(20))
-    model = __import__("sklearn.linear_model").linear_model.LinearRegression()
+    model = LinearRegression()
     metrics = train.time_series_cross_val(X, y, model, n_splits=3)
     assert isinstance(metrics["rmse"], (int, float))
     assert isinstance(metrics["mae"], (int, float))
@@ -38,7 +41,7 @@ def test_time_series_cross_val_min_splits() -> None:
     """Test that cross-validation requires minimum data for splits."""
     X = pd.DataFrame({"x": range(10)})
     y = pd.Series(range(10))
-    model = __import__("sklearn.linear_model").linear_model.LinearRegression()
+    model = LinearRegression()
     # Should work with 2 splits on 10 samples
     metrics = train.time_series_cross_val(X, y, model, n_splits=2)
     assert metrics is not None
@@ -46,7 +49,6 @@ def test_time_series_cross_val_min_splits() -> None:
 
 def test_cross_val_with_different_models() -> None:
     """Test cross-validation works with different model types."""
-    from sklearn.tree import DecisionTreeRegressor
     X = pd.DataFrame({"x1": range(20), "x2": range(20, 40)})
     y = pd.Series(range(20))
     
@@ -55,3 +57,30 @@ def test_cross_val_with_different_models() -> None:
     metrics = train.time_series_cross_val(X, y, model, n_splits=2)
     assert "rmse" in metrics
     assert "mae" in metrics
+
+
+def test_elasticnet_gram_folds_match_refit() -> None:
+    """Test that the running-Gram ElasticNet folds match fitting each fold from scratch."""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(120, 4)) * 3 + 50, columns=list("abcd"))
+    y = pd.Series(X.to_numpy() @ np.array([1.5, -2.0, 0.0, 0.5]) + rng.normal(size=120))
+    model = ElasticNet(alpha=0.1, l1_ratio=0.5, tol=1e-10, max_iter=100_000)
+    splits = list(TimeSeriesSplit(n_splits=3).split(X))
+    fast = train._elasticnet_fold_predictions(X, y, model, splits)
+    slow = train._refit_fold_predictions(X, y, model, splits)
+    for (_, fast_pred), (_, slow_pred) in zip(fast, slow, strict=True):
+        assert np.allclose(fast_pred, slow_pred, rtol=1e-6)
+
+
+def test_training_worker_logs_reach_parent(caplog: pytest.LogCaptureFixture) -> None:
+    """Records logged in a spawned training worker are handled by the parent's logging."""
+    context = multiprocessing.get_context("spawn")
+    with caplog.at_level(logging.INFO), worker_log_queue(context) as log_queue:
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=context,
+            initializer=train._init_training_worker,
+            initargs=(log_queue,),
+        ) as pool:
+            pool.submit(logging.getLogger("src.models.train").info, "hello from %s", "worker").result()
+    assert "hello from worker" in caplog.messages
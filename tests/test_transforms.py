@@ -1,14 +1,8 @@
 """Tests for transform utilities."""
 
-import sys
-from pathlib import Path
+import numpy as np
 import pandas as pd
 
-root_dir = Path(__file__).resolve().parents[1]
-src_path = root_dir / "src"
-if str(src_path) not in sys.path:
-    sys.path.append(str(src_path))
-
 from data import transforms  # type: ignore
 
 
@@ -60,3 +54,32 @@ def test_multiple_rolling_stats() -> None:
     assert "value_roll_std_3" in df.columns
     assert "value_roll_min_3" in df.columns
     assert "value_roll_max_3" in df.columns
+
+
+def test_rolling_stats_match_pandas() -> None:
+    """Test that rolling stats match pandas, including NaN gaps in the input."""
+    values = [5.0, 3.0, np.nan, 8.0, 8.0, 8.0, 1.0, 7.0, 2.0, 9.0, 4.0, 6.0]
+    df = pd.DataFrame({"value": values})
+    stats = ["mean", "std", "min", "max"]
+    df = transforms.add_rolling_features(df, "value", windows=[1, 3, 6], stats=stats)
+    for window in [1, 3, 6]:
+        expected = pd.Series(values).rolling(window)
+        for stat in stats:
+            pd.testing.assert_series_equal(
+                df[f"value_roll_{stat}_{window}"],
+                getattr(expected, stat)(),
+                check_names=False,
+            )
+
+
+def test_fused_lag_rolling_matches_sequential() -> None:
+    """Test that the one-pass builder matches per-column lag and rolling calls."""
+    df = pd.DataFrame({"a": np.arange(15, dtype=float), "b": np.linspace(2.0, 9.0, 15)})
+    # "a_lag_1" is listed after "a", so it must be read from the recomputed lag
+    cols = ["a", "b", "a_lag_1"]
+    expected = df.copy()
+    for col in cols:
+        expected = transforms.add_lag_features(expected, col, lags=[1, 2])
+        expected = transforms.add_rolling_features(expected, col, windows=[3])
+    fused = transforms.add_lag_rolling_features(df, cols, lags=[1, 2], windows=[3])
+    pd.testing.assert_frame_equal(fused, expected)